@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from core.dependencies.users.security import get_current_superuser
+from core.utils.password import password_hasher
+from schemas.users.users import CurrentUser
+from db.session.database import db_helper
+from services.catalog_cache import catalog_cache, suggestions_cache
+from services.jwt import verified_token_cache
+from services.user_cache import authenticated_user_cache
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+)
+
+
+@router.get("/caches", status_code=status.HTTP_200_OK)
+async def get_caches_stats(
+        _: CurrentUser = Depends(get_current_superuser),
+):
+    return {
+        "catalog": catalog_cache.stats(),
+        "suggestions": suggestions_cache.stats(),
+        "statements": db_helper.statement_cache_stats.stats(),
+        "password_hashing": password_hasher.stats(),
+        "verified_tokens": verified_token_cache.stats(),
+        "authenticated_users": authenticated_user_cache.stats(),
+    }
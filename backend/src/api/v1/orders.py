@@ -1,21 +1,27 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Query, Path
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from starlette import status
 
 from core.dependencies.orders.use_cases import get_create_order_use_case, get_get_orders_use_case, \
-    get_cancel_order_use_case
-from core.dependencies.users.security import get_current_active_verified_user
+    get_cancel_order_use_case, get_export_orders_use_case
+from core.dependencies.users.security import get_current_active_verified_user, get_current_superuser
+from core.utils.export import EXPORT_MEDIA_TYPES, ExportFormat
+from core.utils.responses import json_bytes_response
 
-from db.models.users import User
+from schemas.users.users import CurrentUser
 from schemas.orders.orders import OrderOut, OrderItemCreate, OrderParams
-from schemas.orders.use_cases import CreateOrderInput, GetOrdersInput, CancelOrderInput
+from schemas.orders.use_cases import CreateOrderInput, GetOrdersInput, CancelOrderInput, ExportOrdersInput
 
 router = APIRouter(
     prefix="/orders",
     tags=["Orders"],
 )
 
+orders_adapter = TypeAdapter(list[OrderOut])
+
 
 @router.post("", response_model=OrderOut, status_code=status.HTTP_201_CREATED)
 async def create_order(
@@ -23,7 +29,7 @@ async def create_order(
             list[OrderItemCreate], Body(title="Данные для создания пунктов заказа")
         ],
         create_order_use_case=Depends(get_create_order_use_case),
-        user: User = Depends(get_current_active_verified_user),
+        user: CurrentUser = Depends(get_current_active_verified_user),
 ):
     order = await create_order_use_case.execute(
         CreateOrderInput(items=order_items, user_id=user.id)
@@ -37,19 +43,39 @@ async def get_user_orders(
             OrderParams, Query(title="Параметры для фильтрации и сортировки")
         ],
         get_orders_use_case=Depends(get_get_orders_use_case),
-        user: User = Depends(get_current_active_verified_user),
+        user: CurrentUser = Depends(get_current_active_verified_user),
 ):
-    orders = await get_orders_use_case.execute(
+    orders_page = await get_orders_use_case.execute(
         GetOrdersInput(user_id=user.id, params=order_params)
     )
-    return orders
+    response = json_bytes_response(orders_adapter, orders_page.items, fields=order_params.fields)
+    if orders_page.next_cursor:
+        response.headers["X-Next-Cursor"] = orders_page.next_cursor
+    return response
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_orders(
+        export_format: Annotated[ExportFormat, Query(alias="format", title="Формат выгрузки")] = "ndjson",
+        user_id: Annotated[int | None, Query(title="Выгрузить заказы только этого пользователя")] = None,
+        export_orders_use_case=Depends(get_export_orders_use_case),
+        _: CurrentUser = Depends(get_current_superuser),
+):
+    chunks = await export_orders_use_case.execute(
+        ExportOrdersInput(export_format=export_format, user_id=user_id)
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="orders.{export_format}"'},
+    )
 
 
 @router.patch("/{order_id}", response_model=OrderOut, status_code=status.HTTP_200_OK)
 async def cancel_order(
         order_id: Annotated[int, Path(title="ID of order to cancel")],
         cancel_order_use_case=Depends(get_cancel_order_use_case),
-        user: User = Depends(get_current_active_verified_user),
+        user: CurrentUser = Depends(get_current_active_verified_user),
 ):
     order = await cancel_order_use_case.execute(
         CancelOrderInput(order_id=order_id, user_id=user.id)
@@ -1,34 +1,57 @@
+import io
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, Query
+from fastapi import APIRouter, Body, Depends, File, Path, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from starlette import status
 
+from core.config.config import settings
 from core.dependencies.users.security import get_current_superuser
+from core.utils.http_cache import build_etag, etag_matches, not_modified_response, set_cache_headers
+from core.utils.export import EXPORT_MEDIA_TYPES, ExportFormat
+from core.utils.responses import JSONBytesResponse, json_bytes_response
 from core.dependencies.sneaker_model.use_cases import (
     get_create_sneaker_model_use_case,
     get_get_sneakers_models_use_case,
+    get_get_sneakers_models_facets_use_case,
+    get_suggest_sneaker_models_use_case,
     get_update_sneaker_model_use_case,
     get_delete_sneaker_model_use_case,
+    get_export_sneaker_models_use_case,
+    get_import_sneaker_models_use_case,
 )
-from db.models.users import User
+from schemas.users.users import CurrentUser
 from schemas.sneaker_model.sneaker_model import (
+    ImportFormat,
     SneakerModelCreate,
+    SneakerModelFacetsOut,
+    SneakerModelImportReport,
     SneakerModelOut,
     SneakerModelParams,
+    SneakerModelSuggestions,
     SneakerModelUpdate,
 )
 from schemas.sneaker_model.use_cases import (
     CreateSneakerModelInput,
     GetSneakersModelsInput,
+    GetSneakerModelsFacetsInput,
     UpdateSneakerModelInput,
     DeleteSneakerModelInput,
+    ExportSneakerModelsInput,
+    ImportSneakerModelsInput,
+    SuggestSneakerModelsInput,
 )
+from services.catalog_cache import catalog_version
 
 router = APIRouter(
     prefix="/sneaker_model",
     tags=["SneakerModel"],
 )
 
+sneaker_models_adapter = TypeAdapter(list[SneakerModelOut])
+sneaker_models_facets_adapter = TypeAdapter(SneakerModelFacetsOut)
+
 
 @router.post("", response_model=SneakerModelOut, status_code=status.HTTP_201_CREATED)
 async def create_sneaker_model(
@@ -36,7 +59,7 @@ async def create_sneaker_model(
             SneakerModelCreate, Body(title="Данные для создания модели кроссовок")
         ],
         create_sneaker_model_use_case=Depends(get_create_sneaker_model_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     sneaker_model = await create_sneaker_model_use_case.execute(
         CreateSneakerModelInput(sneaker_model=sneaker_model_to_create)
@@ -49,12 +72,87 @@ async def get_sneakers_models_by_filters(
         sneaker_model_params: Annotated[
             SneakerModelParams, Query(title="Параметры для фильтрации и сортировки")
         ],
+        request: Request,
         get_sneakers_models_use_case=Depends(get_get_sneakers_models_use_case),
 ):
-    sneakers_models = await get_sneakers_models_use_case.execute(
+    cache_control = settings.catalog_settings.CATALOG_CACHE_CONTROL
+    etag = build_etag(str(catalog_version), request)
+    # The collection always exists, so If-None-Match: * matches too
+    if etag_matches(request, etag, resource_exists=True):
+        return not_modified_response(etag, cache_control)
+
+    sneakers_models_page = await get_sneakers_models_use_case.execute(
         GetSneakersModelsInput(params=sneaker_model_params)
     )
-    return sneakers_models
+    if sneakers_models_page.items_json is not None:
+        response = JSONBytesResponse(content=sneakers_models_page.items_json)
+    else:
+        response = json_bytes_response(
+            sneaker_models_adapter, sneakers_models_page.items, fields=sneaker_model_params.fields
+        )
+    set_cache_headers(response, etag, cache_control)
+    if sneakers_models_page.next_cursor:
+        response.headers["X-Next-Cursor"] = sneakers_models_page.next_cursor
+    return response
+
+
+@router.get("/facets", response_model=SneakerModelFacetsOut, status_code=status.HTTP_200_OK)
+async def get_sneakers_models_facets(
+        sneaker_model_params: Annotated[
+            SneakerModelParams, Query(title="Параметры для фильтрации и сортировки")
+        ],
+        include_results: Annotated[bool, Query(title="Вернуть страницу моделей вместе с фасетами")] = False,
+        get_sneakers_models_facets_use_case=Depends(get_get_sneakers_models_facets_use_case),
+):
+    facets = await get_sneakers_models_facets_use_case.execute(
+        GetSneakerModelsFacetsInput(params=sneaker_model_params, include_results=include_results)
+    )
+    return json_bytes_response(sneaker_models_facets_adapter, facets)
+
+
+@router.get("/suggest", response_model=SneakerModelSuggestions, status_code=status.HTTP_200_OK)
+async def suggest_sneakers_models(
+        q: Annotated[str, Query(title="Префикс или часть названия", min_length=1, max_length=100)],
+        limit: Annotated[int, Query(title="Количество подсказок", ge=1, le=50)] = settings.catalog_settings.SUGGEST_LIMIT,
+        suggest_sneaker_models_use_case=Depends(get_suggest_sneaker_models_use_case),
+):
+    suggestions = await suggest_sneaker_models_use_case.execute(
+        SuggestSneakerModelsInput(query=q, limit=limit)
+    )
+    return suggestions
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_sneakers_models(
+        export_format: Annotated[ExportFormat, Query(alias="format", title="Формат выгрузки")] = "ndjson",
+        include_variants: Annotated[bool, Query(title="Выгрузить размеры вместе с моделями")] = False,
+        export_sneaker_models_use_case=Depends(get_export_sneaker_models_use_case),
+        _: CurrentUser = Depends(get_current_superuser),
+):
+    chunks = await export_sneaker_models_use_case.execute(
+        ExportSneakerModelsInput(export_format=export_format, include_variants=include_variants)
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="sneaker_models.{export_format}"'},
+    )
+
+
+@router.post("/import", response_model=SneakerModelImportReport, status_code=status.HTTP_200_OK)
+async def import_sneakers_models(
+        file: Annotated[UploadFile, File(title="CSV или JSONL файл с моделями и размерами")],
+        import_format: Annotated[ImportFormat, Query(alias="format", title="Формат файла")] = "csv",
+        import_sneaker_models_use_case=Depends(get_import_sneaker_models_use_case),
+        _: CurrentUser = Depends(get_current_superuser),
+):
+    report = await import_sneaker_models_use_case.execute(
+        ImportSneakerModelsInput(
+            lines=io.TextIOWrapper(file.file, encoding="utf-8", newline=""),
+            import_format=import_format,
+        )
+    )
+    return report
 
 
 @router.put(
@@ -68,7 +166,7 @@ async def update_sneaker_model_by_id(
             SneakerModelUpdate, Body(title="Данные для изменения модели кроссовок")
         ],
         update_sneaker_model_use_case=Depends(get_update_sneaker_model_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     updated_sneaker_model = await update_sneaker_model_use_case.execute(
         UpdateSneakerModelInput(
@@ -83,7 +181,7 @@ async def update_sneaker_model_by_id(
 async def delete_sneaker_model_by_id(
         sneaker_model_id: Annotated[int, Path(title="ID модели кроссовок")],
         delete_sneaker_model_use_case=Depends(get_delete_sneaker_model_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     await delete_sneaker_model_use_case.execute(
         DeleteSneakerModelInput(sneaker_model_id=sneaker_model_id)
@@ -1,15 +1,18 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, Query
+from fastapi import APIRouter, Body, Depends, Path, Query, Request, Response
 from starlette import status
 
 from core.dependencies.sneaker_variant.use_cases import get_create_sneaker_variant_use_case, \
     get_update_sneaker_variant_quantity_use_case, get_delete_sneaker_variant_use_case, get_get_sneaker_variant_use_case
+from core.config.config import settings
 from core.dependencies.users.security import get_current_superuser
-from db.models.users import User
+from core.utils.http_cache import build_etag, etag_matches, not_modified_response, set_cache_headers
+from schemas.users.users import CurrentUser
 from schemas.sneaker_variant.sneaker_variant import SneakerVariantOut, SneakerVariantCreate
 from schemas.sneaker_variant.use_cases import CreateSneakerVariantInput, UpdateSneakerVariantQuantityInput, \
     DeleteSneakerVariantInput, GetSneakerVariantInput
+from services.catalog_cache import catalog_version
 
 router = APIRouter(
     prefix="/sneaker_variant",
@@ -20,11 +23,21 @@ router = APIRouter(
 @router.get("/{sneaker_variant_id}", response_model=SneakerVariantOut, status_code=status.HTTP_200_OK)
 async def get_sneaker_variant(
         sneaker_variant_id: Annotated[int, Path(title="ID of sneaker variant")],
+        request: Request,
+        response: Response,
         get_sneaker_variant_use_case=Depends(get_get_sneaker_variant_use_case),
 ):
+    cache_control = settings.catalog_settings.CATALOG_CACHE_CONTROL
+    etag = build_etag(str(catalog_version), request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag, cache_control)
+
     sneaker_variant = await get_sneaker_variant_use_case.execute(
         GetSneakerVariantInput(sneaker_variant_id=sneaker_variant_id)
     )
+    if etag_matches(request, etag, resource_exists=True):
+        return not_modified_response(etag, cache_control)
+    set_cache_headers(response, etag, cache_control)
     return sneaker_variant
 
 
@@ -34,7 +47,7 @@ async def create_sneaker_variant(
             SneakerVariantCreate, Body(title="Data for creating sneaker variant")
         ],
         create_sneaker_variant_use_case=Depends(get_create_sneaker_variant_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     sneaker_variant = await create_sneaker_variant_use_case.execute(
         CreateSneakerVariantInput(sneaker_variant=sneaker_variant_to_create)
@@ -47,7 +60,7 @@ async def update_sneaker_variant_quantity(
         sneaker_variant_id: Annotated[int, Path(title="ID of sneaker variant")],
         quantity_delta: Annotated[int, Query(title="Quantity delta")],
         update_sneaker_variant_use_case=Depends(get_update_sneaker_variant_quantity_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     sneaker_variant = await update_sneaker_variant_use_case.execute(
         UpdateSneakerVariantQuantityInput(sneaker_variant_id=sneaker_variant_id, quantity_delta=quantity_delta)
@@ -59,7 +72,7 @@ async def update_sneaker_variant_quantity(
 async def delete_sneaker_variant(
         sneaker_variant_id: Annotated[int, Path(title="ID of sneaker variant")],
         delete_sneaker_variant_use_case=Depends(get_delete_sneaker_variant_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     await delete_sneaker_variant_use_case.execute(
         DeleteSneakerVariantInput(sneaker_variant_id=sneaker_variant_id)
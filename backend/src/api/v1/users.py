@@ -18,8 +18,7 @@ from core.dependencies.users.security import (
     get_current_active_verified_user,
     get_current_superuser,
 )
-from db.models.users import User
-from schemas.users.users import UserOut, UserCreate, ChangePasswordRequest
+from schemas.users.users import UserOut, UserCreate, ChangePasswordRequest, CurrentUser
 from schemas.users.use_cases import (
     GetUserInput,
     DeleteUserInput,
@@ -40,16 +39,18 @@ router = APIRouter(
 
 @router.get("/me", response_model=UserOut, status_code=status.HTTP_200_OK)
 async def get_current_user_info(
-        current_user: User = Depends(get_current_active_verified_user),
+        get_user_use_case=Depends(get_get_user_use_case),
+        current_user: CurrentUser = Depends(get_current_active_verified_user),
 ):
-    return current_user.to_read_model()
+    user = await get_user_use_case.execute(GetUserInput(user_id=current_user.id, include_orders=False))
+    return user
 
 
 @router.get("/{user_id}", response_model=UserOut, status_code=status.HTTP_200_OK)
 async def get_user_by_id(
         user_id: Annotated[int, Path(title="ID пользователя")],
         get_user_use_case=Depends(get_get_user_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     user = await get_user_use_case.execute(GetUserInput(user_id=user_id))
     return user
@@ -78,7 +79,7 @@ async def verify_email(
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_current_user(
         delete_user_use_case=Depends(get_delete_user_use_case),
-        current_user: User = Depends(get_current_active_verified_user),
+        current_user: CurrentUser = Depends(get_current_active_verified_user),
 ):
     await delete_user_use_case.execute(DeleteUserInput(user_id=current_user.id))
 
@@ -87,7 +88,7 @@ async def delete_current_user(
 async def delete_user(
         user_id: Annotated[int, Path(title="ID пользователя для удаления")],
         delete_user_use_case=Depends(get_delete_user_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     await delete_user_use_case.execute(DeleteUserInput(user_id=user_id))
 
@@ -96,7 +97,7 @@ async def delete_user(
 async def update_current_user_email(
         new_email: Annotated[EmailStr, Body(title="Новый email")],
         update_user_email_use_case=Depends(get_update_user_email_use_case),
-        current_user: User = Depends(get_current_active_verified_user),
+        current_user: CurrentUser = Depends(get_current_active_verified_user),
 ):
     updated_user = await update_user_email_use_case.execute(
         UpdateUserEmailInput(
@@ -114,7 +115,7 @@ async def update_user_email(
         user_id: Annotated[int, Path(title="ID пользователя для обновления")],
         new_email: Annotated[EmailStr, Body(title="Новый email")],
         update_user_email_use_case=Depends(get_update_user_email_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     updated_user = await update_user_email_use_case.execute(
         UpdateUserEmailInput(
@@ -129,7 +130,7 @@ async def update_user_email(
 async def update_current_user_username(
         new_username: Annotated[str, Body(title="Новое имя пользователя", min_length=3)],
         update_user_username_use_case=Depends(get_update_user_username_use_case),
-        current_user: User = Depends(get_current_active_verified_user),
+        current_user: CurrentUser = Depends(get_current_active_verified_user),
 ):
     updated_user = await update_user_username_use_case.execute(
         UpdateUserUsernameInput(user_id=current_user.id, new_username=new_username)
@@ -144,7 +145,7 @@ async def update_user_username(
         user_id: Annotated[int, Path(title="ID пользователя для обновления")],
         new_username: Annotated[str, Body(title="Новое имя пользователя", min_length=3)],
         update_user_username_use_case=Depends(get_update_user_username_use_case),
-        _: User = Depends(get_current_superuser),
+        _: CurrentUser = Depends(get_current_superuser),
 ):
     updated_user = await update_user_username_use_case.execute(
         UpdateUserUsernameInput(user_id=user_id, new_username=new_username)
@@ -182,7 +183,7 @@ async def change_current_user_password(
         password_data: Annotated[
             ChangePasswordRequest, Body(title="Данные для смены пароля")
         ],
-        current_user: User = Depends(get_current_active_verified_user),
+        current_user: CurrentUser = Depends(get_current_active_verified_user),
         change_password_use_case=Depends(get_change_password_use_case),
 ):
     await change_password_use_case.execute(
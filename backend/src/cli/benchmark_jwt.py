@@ -0,0 +1,62 @@
+"""Measure JWT sign and verify throughput per algorithm on the payloads TokenService issues.
+
+    python -m cli.benchmark_jwt --duration 2
+
+Keys are generated in memory and prepared once, as JWTKeyManager does, so the numbers cover
+the signature operations and token encoding only.
+"""
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Callable
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+
+from core.utils.jwt_keys import SUPPORTED_ALGORITHMS, generate_key_pair, key_id_for
+
+SAMPLE_SUBJECT = "benchmark_username"
+
+
+def _ops_per_second(operation: Callable[[], object], duration: float) -> float:
+    operations = 0
+    started_at = time.perf_counter()
+    deadline = started_at + duration
+    while (now := time.perf_counter()) < deadline:
+        for _ in range(16):
+            operation()
+        operations += 16
+    return operations / (now - started_at)
+
+
+def benchmark(algorithm: str, duration: float) -> dict[str, float | int]:
+    private_pem, public_pem = generate_key_pair(algorithm)
+    prepare_key = get_default_algorithms()[algorithm].prepare_key
+    private_key, public_key = prepare_key(private_pem), prepare_key(public_pem)
+    headers = {"kid": key_id_for(public_pem)}
+    payload = {"exp": datetime.now(UTC) + timedelta(minutes=15), "sub": SAMPLE_SUBJECT}
+    token = jwt.encode(payload, private_key, algorithm=algorithm, headers=headers)
+
+    return {
+        "sign": _ops_per_second(
+            lambda: jwt.encode(payload, private_key, algorithm=algorithm, headers=headers), duration
+        ),
+        "verify": _ops_per_second(lambda: jwt.decode(token, public_key, algorithms=[algorithm]), duration),
+        "token_bytes": len(token),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JWT sign/verify operations per second")
+    parser.add_argument("--algorithm", choices=SUPPORTED_ALGORITHMS, action="append")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per measurement")
+    args = parser.parse_args()
+
+    print(f"{'algorithm':<10}{'sign/s':>12}{'verify/s':>12}{'token bytes':>14}")
+    for algorithm in args.algorithm or SUPPORTED_ALGORITHMS:
+        result = benchmark(algorithm, args.duration)
+        print(f"{algorithm:<10}{result['sign']:>12.0f}{result['verify']:>12.0f}{result['token_bytes']:>14}")
+
+
+if __name__ == "__main__":
+    main()
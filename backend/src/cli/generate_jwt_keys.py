@@ -0,0 +1,80 @@
+"""Generate a JWT signing key pair for RS256, ES256 or EdDSA.
+
+    python -m cli.generate_jwt_keys --algorithm EdDSA --retire
+
+--retire copies the current public key into verification_keys_dir as <kid>.<algorithm>.pem,
+using the kid its tokens carry (KEY_ID, or the key's fingerprint) and --current-algorithm
+(ALGORITHM by default), before it is replaced. Keep that file until the refresh tokens it
+signed have expired. With an explicit KEY_ID, pass the new pair's kid as --key-id and set
+KEY_ID to it afterwards.
+
+Rotation is not seamless. Running processes pick up the new files within
+key_reload_interval_seconds. One whose ALGORITHM does not fit the new pair logs the failure
+and keeps signing and verifying with its previous keys until it is restarted with the new
+ALGORITHM. Until every process has the new pair, tokens issued by one process can be rejected
+(401) by another, so expect some clients to log in again.
+"""
+import argparse
+import os
+from pathlib import Path
+
+from core.config.config import settings
+from core.utils.jwt_keys import SUPPORTED_ALGORITHMS, generate_key_pair, key_id_for, retired_key_name
+
+
+def _write(path: Path, data: bytes, mode: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode), "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def retire_public_key(
+        public_key_path: Path, verification_keys_dir: Path, algorithm: str, key_id: str | None = None
+) -> Path | None:
+    """key_id is the kid the key was published under, when it was set explicitly."""
+    if not public_key_path.exists():
+        return None
+    public_pem = public_key_path.read_bytes()
+    retired_path = verification_keys_dir / retired_key_name(key_id or key_id_for(public_pem), algorithm)
+    _write(retired_path, public_pem, 0o644)
+    return retired_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a JWT signing key pair")
+    parser.add_argument("--algorithm", choices=SUPPORTED_ALGORITHMS, default=settings.auth_jwt.algorithm)
+    parser.add_argument("--private-key", type=Path, default=settings.auth_jwt.private_key_path)
+    parser.add_argument("--public-key", type=Path, default=settings.auth_jwt.public_key_path)
+    parser.add_argument("--retire", action="store_true", help="keep the current public key for verification")
+    parser.add_argument(
+        "--current-algorithm", default=settings.auth_jwt.algorithm, help="algorithm the current key signs with"
+    )
+    parser.add_argument("--verification-keys-dir", type=Path, default=settings.auth_jwt.verification_keys_dir)
+    parser.add_argument("--key-id", help="kid for the new pair when KEY_ID is set explicitly")
+    args = parser.parse_args()
+
+    current_key_id = settings.auth_jwt.key_id
+    if args.retire:
+        if args.verification_keys_dir is None:
+            parser.error("--retire needs --verification-keys-dir or verification_keys_dir in settings")
+        if current_key_id is not None and args.key_id in (None, current_key_id):
+            parser.error(f"KEY_ID is {current_key_id!r}; pass a different --key-id for the new pair")
+        retired_path = retire_public_key(
+            args.public_key, args.verification_keys_dir, args.current_algorithm, current_key_id
+        )
+        if retired_path is not None:
+            print(f"retired {args.public_key} -> {retired_path}")
+
+    private_pem, public_pem = generate_key_pair(args.algorithm)
+    _write(args.private_key, private_pem, 0o600)
+    _write(args.public_key, public_pem, 0o644)
+    if args.key_id is not None:
+        print(f"{args.algorithm} key pair written, set KEY_ID={args.key_id}")
+    else:
+        print(f"{args.algorithm} key pair written, kid {key_id_for(public_pem)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+from pathlib import Path
+
+from db.session.database import db_helper
+from repositories.catalog_import import CatalogImportRepository
+from schemas.sneaker_model.use_cases import ImportSneakerModelsInput
+from services.catalog_import import CatalogImportService
+from use_cases.sneakers_model.import_sneaker_models import ImportSneakerModelsUseCase
+
+
+async def import_catalog(path: Path, import_format: str) -> None:
+    async with db_helper.get_session() as session:
+        import_sneaker_models_use_case = ImportSneakerModelsUseCase(
+            lambda: CatalogImportService(lambda: CatalogImportRepository(session))
+        )
+        with path.open(encoding="utf-8", newline="") as lines:
+            report = await import_sneaker_models_use_case.execute(
+                ImportSneakerModelsInput(lines=lines, import_format=import_format)
+            )
+    print(report.model_dump_json(indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk import sneaker models and variants from a CSV or JSONL feed")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="defaults to the file extension")
+    args = parser.parse_args()
+    import_format = args.format or ("jsonl" if args.path.suffix in (".jsonl", ".ndjson") else "csv")
+    asyncio.run(import_catalog(args.path, import_format))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ class DatabaseSettings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_PORT: str
+    DB_QUERY_CACHE_SIZE: int = 1200
 
 
 class EmailSettings(BaseSettings):
@@ -35,23 +36,53 @@ class EmailSettings(BaseSettings):
 class AuthJWTSettings(BaseSettings):
     private_key_path: Path = BASE_DIR / "certs" / "jwt-private.pem"
     public_key_path: Path = BASE_DIR / "certs" / "jwt-public.pem"
+    verification_keys_dir: Path | None = None
+    key_id: str | None = None
+    key_reload_interval_seconds: float = 30.0
+    token_cache_enabled: bool = True
+    token_cache_size: int = 4096
+    token_cache_max_ttl_seconds: float = 300.0
+    user_cache_enabled: bool = True
+    user_cache_size: int = 4096
+    user_cache_ttl_seconds: float = 30.0
     algorithm: str = os.environ.get("ALGORITHM")
     access_token_expire_minutes: int = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES"))
     refresh_token_expire_days: int = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS"))
     verification_token_expire_minutes: int = int(os.environ.get("VERIFICATION_TOKEN_EXPIRE_MINUTES"))
 
 
+class PasswordHashingSettings(BaseSettings):
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+
+
 class APISettings(BaseSettings):
     BASE_URL: str = "http://localhost:8000"
     BALANCE_AWARD_PERCENT: int
 
 
+class CatalogSettings(BaseSettings):
+    CATALOG_CACHE_SIZE: int = 512
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    CATALOG_CACHE_CONTROL: str = "public, max-age=60"
+    CATALOG_ENGINE_ENABLED: bool = False
+    CATALOG_SNAPSHOT_DIR: Path | None = None
+    SUGGEST_LIMIT: int = 10
+    SUGGEST_CACHE_SIZE: int = 1024
+    SUGGEST_CACHE_TTL_SECONDS: int = 60
+    PRICE_BUCKETS: list[int] = [50, 100, 150, 200, 300]
+    EXPORT_BATCH_SIZE: int = 1000
+
+
 class Settings(BaseSettings):
     test_db_settings: TestDatabaseSettings = TestDatabaseSettings()
     db_settings: DatabaseSettings = DatabaseSettings()
     email_settings: EmailSettings = EmailSettings()
     auth_jwt: AuthJWTSettings = AuthJWTSettings()
+    password_hashing_settings: PasswordHashingSettings = PasswordHashingSettings()
     api_settings: APISettings = APISettings()
+    catalog_settings: CatalogSettings = CatalogSettings()
 
 
 settings = Settings()
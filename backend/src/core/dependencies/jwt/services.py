@@ -3,5 +3,8 @@ from typing import Callable
 from services.jwt import TokenService
 
 
+token_service = TokenService()
+
+
 def get_token_service_factory() -> Callable[[], TokenService]:
-    return lambda: TokenService()
+    return lambda: token_service
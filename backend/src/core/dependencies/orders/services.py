@@ -1,10 +1,12 @@
-from typing import Callable
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
 
 from fastapi import Depends
 
 from core.dependencies.orders.database import (
     get_order_repository_factory, get_order_item_repository_factory,
 )
+from db.session.database import db_helper
 from repositories.order import OrderRepository
 from services.order_items import OrderItemService
 from services.orders import OrderService
@@ -24,3 +26,14 @@ def get_order_item_service_factory(
         ),
 ) -> Callable[[], OrderItemService]:
     return lambda: OrderItemService(order_item_repository_factory)
+
+
+def get_streaming_order_service_factory() -> Callable[[], AsyncContextManager[OrderService]]:
+    """Streamed responses outlive the request-scoped session, so each stream opens its own."""
+
+    @asynccontextmanager
+    async def streaming_order_service() -> AsyncIterator[OrderService]:
+        async with db_helper.get_session() as session:
+            yield OrderService(lambda: OrderRepository(session))
+
+    return streaming_order_service
@@ -1,8 +1,12 @@
-from typing import Callable
+from typing import AsyncContextManager, Callable
 
 from fastapi import Depends
 
-from core.dependencies.orders.services import get_order_service_factory, get_order_item_service_factory
+from core.dependencies.orders.services import (
+    get_order_service_factory,
+    get_order_item_service_factory,
+    get_streaming_order_service_factory,
+)
 from core.dependencies.sneaker_variant.services import get_sneaker_variant_service_factory
 from core.dependencies.users.services import get_user_service_factory
 from services.order_items import OrderItemService
@@ -11,6 +15,7 @@ from services.sneaker_variant import SneakerVariantService
 from services.users import UserService
 from use_cases.orders.cancel_order import CancelOrderUseCase
 from use_cases.orders.create_order import CreateOrderUseCase
+from use_cases.orders.export_orders import ExportOrdersUseCase
 from use_cases.orders.get_orders import GetOrdersUseCase
 
 
@@ -53,3 +58,11 @@ def get_cancel_order_use_case(
         ),
 ) -> CancelOrderUseCase:
     return CancelOrderUseCase(order_service_factory, user_service_factory)
+
+
+def get_export_orders_use_case(
+        order_service_factory: Callable[[], AsyncContextManager[OrderService]] = Depends(
+            get_streaming_order_service_factory
+        ),
+) -> ExportOrdersUseCase:
+    return ExportOrdersUseCase(order_service_factory)
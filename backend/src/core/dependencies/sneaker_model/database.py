@@ -4,6 +4,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.session.database import get_async_session
+from repositories.catalog_import import CatalogImportRepository
 from repositories.sneaker_model import SneakerModelRepository
 
 
@@ -11,3 +12,9 @@ def get_sneaker_model_repository_factory(
         session: AsyncSession = Depends(get_async_session),
 ) -> Callable[[], SneakerModelRepository]:
     return lambda: SneakerModelRepository(session)
+
+
+def get_catalog_import_repository_factory(
+        session: AsyncSession = Depends(get_async_session),
+) -> Callable[[], CatalogImportRepository]:
+    return lambda: CatalogImportRepository(session)
@@ -1,11 +1,16 @@
-from typing import Callable
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
 
 from fastapi import Depends
 
 from core.dependencies.sneaker_model.database import (
+    get_catalog_import_repository_factory,
     get_sneaker_model_repository_factory,
 )
+from db.session.database import db_helper
+from repositories.catalog_import import CatalogImportRepository
 from repositories.sneaker_model import SneakerModelRepository
+from services.catalog_import import CatalogImportService
 from services.sneaker_model import SneakerModelService
 
 
@@ -15,3 +20,22 @@ def get_sneaker_model_service_factory(
         ),
 ) -> Callable[[], SneakerModelService]:
     return lambda: SneakerModelService(sneaker_model_repository_factory)
+
+
+def get_streaming_sneaker_model_service_factory() -> Callable[[], AsyncContextManager[SneakerModelService]]:
+    """Streamed responses outlive the request-scoped session, so each stream opens its own."""
+
+    @asynccontextmanager
+    async def streaming_sneaker_model_service() -> AsyncIterator[SneakerModelService]:
+        async with db_helper.get_session() as session:
+            yield SneakerModelService(lambda: SneakerModelRepository(session))
+
+    return streaming_sneaker_model_service
+
+
+def get_catalog_import_service_factory(
+        catalog_import_repository_factory: Callable[[], CatalogImportRepository] = Depends(
+            get_catalog_import_repository_factory
+        ),
+) -> Callable[[], CatalogImportService]:
+    return lambda: CatalogImportService(catalog_import_repository_factory)
@@ -1,14 +1,23 @@
-from typing import Callable
+from typing import AsyncContextManager, Callable
 
 from fastapi import Depends
 
-from core.dependencies.sneaker_model.services import get_sneaker_model_service_factory
+from core.dependencies.sneaker_model.services import (
+    get_catalog_import_service_factory,
+    get_sneaker_model_service_factory,
+    get_streaming_sneaker_model_service_factory,
+)
+from services.catalog_import import CatalogImportService
 from services.sneaker_model import SneakerModelService
 from use_cases.sneakers_model.create_sneaker_model import CreateSneakerModelUseCase
 from use_cases.sneakers_model.delete_sneaker_model import DeleteSneakerModelUseCase
+from use_cases.sneakers_model.export_sneaker_models import ExportSneakerModelsUseCase
 from use_cases.sneakers_model.get_sneaker_model import (
     GetSneakersModelsUseCase,
 )
+from use_cases.sneakers_model.get_sneaker_model_facets import GetSneakerModelsFacetsUseCase
+from use_cases.sneakers_model.import_sneaker_models import ImportSneakerModelsUseCase
+from use_cases.sneakers_model.suggest_sneaker_models import SuggestSneakerModelsUseCase
 from use_cases.sneakers_model.update_sneaker_model import UpdateSneakerModelUseCase
 
 
@@ -28,6 +37,22 @@ def get_get_sneakers_models_use_case(
     return GetSneakersModelsUseCase(sneaker_model_service_factory)
 
 
+def get_get_sneakers_models_facets_use_case(
+        sneaker_model_service_factory: Callable[[], SneakerModelService] = Depends(
+            get_sneaker_model_service_factory
+        ),
+) -> GetSneakerModelsFacetsUseCase:
+    return GetSneakerModelsFacetsUseCase(sneaker_model_service_factory)
+
+
+def get_suggest_sneaker_models_use_case(
+        sneaker_model_service_factory: Callable[[], SneakerModelService] = Depends(
+            get_sneaker_model_service_factory
+        ),
+) -> SuggestSneakerModelsUseCase:
+    return SuggestSneakerModelsUseCase(sneaker_model_service_factory)
+
+
 def get_update_sneaker_model_use_case(
         sneaker_model_service_factory: Callable[[], SneakerModelService] = Depends(
             get_sneaker_model_service_factory
@@ -42,3 +67,19 @@ def get_delete_sneaker_model_use_case(
         ),
 ) -> DeleteSneakerModelUseCase:
     return DeleteSneakerModelUseCase(sneaker_model_service_factory)
+
+
+def get_export_sneaker_models_use_case(
+        sneaker_model_service_factory: Callable[[], AsyncContextManager[SneakerModelService]] = Depends(
+            get_streaming_sneaker_model_service_factory
+        ),
+) -> ExportSneakerModelsUseCase:
+    return ExportSneakerModelsUseCase(sneaker_model_service_factory)
+
+
+def get_import_sneaker_models_use_case(
+        catalog_import_service_factory: Callable[[], CatalogImportService] = Depends(
+            get_catalog_import_service_factory
+        ),
+) -> ImportSneakerModelsUseCase:
+    return ImportSneakerModelsUseCase(catalog_import_service_factory)
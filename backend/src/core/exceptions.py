@@ -54,6 +54,22 @@ class NoDataProvidedException(BaseModelException):
         )
 
 
+class InvalidCursorException(BaseModelException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Invalid pagination cursor",
+        )
+
+
+class ServiceBusyException(BaseModelException):
+    def __init__(self, service: str):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=f"{service} is busy, try again later",
+        )
+
+
 # User exceptions
 class UserAlreadyVerifiedException(BaseModelException):
     def __init__(self, user_id: str):
@@ -0,0 +1,50 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Literal
+
+from pydantic import BaseModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def encode_export(
+        items: AsyncIterator[BaseModel],
+        export_format: ExportFormat,
+        fieldnames: list[str],
+        batch_size: int,
+) -> AsyncIterator[bytes]:
+    """Encode read models as NDJSON lines or CSV rows, flushing one chunk per batch_size items.
+
+    In CSV, nested values (variants, order items) are written as JSON inside the cell.
+    """
+    buffer = io.StringIO()
+    writer = None
+    if export_format == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+
+    count = 0
+    async for item in items:
+        if writer is None:
+            buffer.write(item.model_dump_json(include=set(fieldnames)))
+            buffer.write("\n")
+        else:
+            row = item.model_dump(mode="json", include=set(fieldnames))
+            writer.writerow({
+                key: json.dumps(value) if isinstance(value, (list, dict)) else value
+                for key, value in row.items()
+            })
+        count += 1
+        if count % batch_size == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
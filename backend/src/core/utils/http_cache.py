@@ -0,0 +1,31 @@
+import hashlib
+
+from fastapi import Request, Response
+from starlette import status
+
+
+def build_etag(version: str, request: Request) -> str:
+    url_digest = hashlib.blake2b(f"{request.url.path}?{request.url.query}".encode(), digest_size=8).hexdigest()
+    return f'W/"{version}-{url_digest}"'
+
+
+def etag_matches(request: Request, etag: str, resource_exists: bool = False) -> bool:
+    """If-None-Match: * only matches once the caller has confirmed the resource exists."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    if "*" in candidates:
+        return resource_exists
+    return etag in candidates or etag.removeprefix("W/") in candidates
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, cache_control)
+    return response
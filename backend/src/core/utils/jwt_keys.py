@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import InvalidKeyError
+
+logger = logging.getLogger(__name__)
+
+_KEY_CHECK = b"jwt key pair check"
+
+# Algorithms with key generation and benchmark tooling; any asymmetric pyjwt algorithm can sign.
+SUPPORTED_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
+
+def key_id_for(public_pem: bytes) -> str:
+    return hashlib.sha256(public_pem).hexdigest()[:16]
+
+
+def retired_key_name(kid: str, algorithm: str) -> str:
+    if "." in kid:
+        raise ValueError(f"kid {kid!r} cannot be stored as a retired key file, it contains '.'")
+    return f"{kid}.{algorithm}.pem"
+
+
+def generate_key_pair(algorithm: str) -> tuple[bytes, bytes]:
+    """Return (private PEM, public PEM) for one of SUPPORTED_ALGORITHMS."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        raise ValueError(f"Unsupported JWT algorithm {algorithm!r}, expected one of {SUPPORTED_ALGORITHMS}")
+
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+class JWTKeyManager:
+    """Parses signing and verification keys once and re-parses them only when a key file changes.
+
+    The signing key is published under its kid; verification keys are the signing key's public
+    half plus every <kid>.<algorithm>.pem in verification_keys_dir, so retired keys keep verifying
+    old tokens with the algorithm they signed them with. A bare <kid>.pem uses the configured
+    algorithm; a retired file that cannot be parsed is logged and skipped.
+
+    If the signing pair cannot be used on reload (wrong algorithm for this process, or the private
+    and public files are from different pairs while a rotation is half written), the failure is
+    logged and the previous keys stay in service until the files change again.
+    """
+
+    def __init__(
+            self,
+            algorithm: str,
+            private_key_path: Path,
+            public_key_path: Path,
+            verification_keys_dir: Path | None = None,
+            key_id: str | None = None,
+            reload_interval: float = 30.0,
+    ):
+        if algorithm not in get_default_algorithms():
+            raise ValueError(f"JWT algorithm {algorithm!r} is unknown or requires the cryptography package")
+        self.algorithm = algorithm
+        self.private_key_path = private_key_path
+        self.public_key_path = public_key_path
+        self.verification_keys_dir = verification_keys_dir
+        self.key_id = key_id
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        self._fingerprint: tuple | None = None
+        self._checked_at = 0.0
+        # (signing kid, signing key, (key, algorithm) by kid), swapped as a whole on reload
+        self._keys: tuple[str, Any, dict[str, tuple[Any, str]]] | None = None
+
+    def signing_key(self) -> tuple[str, Any]:
+        signing_kid, signing_key, _ = self._refresh()
+        return signing_kid, signing_key
+
+    def verification_key(self, kid: str | None) -> tuple[Any, str] | None:
+        """Return (key, algorithm). Tokens issued before kids were added carry none and are checked
+        against the current key."""
+        signing_kid, _, verification_keys = self._refresh()
+        return verification_keys.get(kid or signing_kid)
+
+    def _key_files(self) -> list[Path]:
+        paths = [self.private_key_path, self.public_key_path]
+        if self.verification_keys_dir is not None and self.verification_keys_dir.is_dir():
+            paths.extend(sorted(self.verification_keys_dir.glob("*.pem")))
+        return paths
+
+    def _refresh(self) -> tuple[str, Any, dict[str, tuple[Any, str]]]:
+        now = time.monotonic()
+        if self._keys is not None and now - self._checked_at < self.reload_interval:
+            return self._keys
+        with self._lock:
+            if self._keys is None or now - self._checked_at >= self.reload_interval:
+                fingerprint = None
+                try:
+                    paths = self._key_files()
+                    fingerprint = tuple(
+                        (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+                        for path, stat in ((path, os.stat(path)) for path in paths)
+                    )
+                    if fingerprint != self._fingerprint:
+                        self._keys = self._load(paths)
+                except (InvalidKeyError, ValueError, OSError):
+                    if self._keys is None:
+                        raise
+                    logger.exception("Failed to reload JWT keys, keeping the previous ones")
+                # Recorded on failure too, so a bad key set is not re-parsed until a file changes again
+                if fingerprint is not None:
+                    self._fingerprint = fingerprint
+                self._checked_at = now
+            return self._keys
+
+    def _load(self, paths: list[Path]) -> tuple[str, Any, dict[str, tuple[Any, str]]]:
+        algorithms = get_default_algorithms()
+        public_pem = self.public_key_path.read_bytes()
+        signing_kid = self.key_id or key_id_for(public_pem)
+
+        verification_keys = {}
+        for path in paths[2:]:
+            kid, _, algorithm_name = path.stem.partition(".")
+            algorithm_name = algorithm_name or self.algorithm
+            try:
+                verification_keys[kid] = (algorithms[algorithm_name].prepare_key(path.read_bytes()), algorithm_name)
+            except (KeyError, InvalidKeyError, ValueError, OSError) as e:
+                logger.warning("Skipping verification key %s: %r", path, e)
+        algorithm = algorithms[self.algorithm]
+        signing_key = algorithm.prepare_key(self.private_key_path.read_bytes())
+        public_key = algorithm.prepare_key(public_pem)
+        # Catches a pair of another algorithm's type as well as files from two different pairs
+        try:
+            key_pair_matches = algorithm.verify(_KEY_CHECK, public_key, algorithm.sign(_KEY_CHECK, signing_key))
+        except (TypeError, AttributeError) as e:
+            raise InvalidKeyError(f"Key pair cannot be used with {self.algorithm}: {e!r}") from e
+        if not key_pair_matches:
+            raise InvalidKeyError(f"{self.private_key_path} and {self.public_key_path} are not one key pair")
+        verification_keys[signing_kid] = (public_key, self.algorithm)
+
+        return signing_kid, signing_key, verification_keys
@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from core.exceptions import InvalidCursorException
+from core.utils.repository import OrderByType
+
+
+def _keyset_fields(order_by: OrderByType | None) -> list[str]:
+    if order_by:
+        return [order_by[0], "id"]
+    return ["id"]
+
+
+def _sort_key(order_by: OrderByType | None) -> str:
+    if order_by:
+        return f"{order_by[0]}:{order_by[1]}"
+    return "id:desc"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def build_cursor(item: Any, order_by: OrderByType | None = None) -> str:
+    payload = {
+        "sort": _sort_key(order_by),
+        "keys": [_encode_value(getattr(item, field)) for field in _keyset_fields(order_by)],
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def parse_cursor(cursor: str, order_by: OrderByType | None = None) -> tuple:
+    if order_by and not isinstance(order_by[0], str):
+        raise InvalidCursorException()
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        sort, keys = payload["sort"], payload["keys"]
+        decoded_keys = tuple(_decode_value(key) for key in keys)
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorException()
+
+    if sort != _sort_key(order_by) or len(decoded_keys) != len(_keyset_fields(order_by)):
+        raise InvalidCursorException()
+    return decoded_keys
@@ -1,5 +1,14 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 import bcrypt
 
+from core.config.config import settings
+from core.exceptions import ServiceBusyException
+
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
@@ -8,3 +17,55 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded pool and rejects work once max_queue calls are waiting."""
+
+    def __init__(self, max_workers: int, max_queue: int, use_processes: bool = False):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceBusyException("Password hashing")
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "queued": max(self._in_flight - self.max_workers, 0),
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+        }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hashing_settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.password_hashing_settings.PASSWORD_HASH_MAX_QUEUE,
+    use_processes=settings.password_hashing_settings.PASSWORD_HASH_USE_PROCESSES,
+)
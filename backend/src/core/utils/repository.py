@@ -1,13 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Type, Optional, Any, Literal
+from typing import TypeVar, Generic, Type, Optional, Any, Literal, AsyncIterator, Callable
 
-from sqlalchemy import select, and_, update, delete, insert
+from sqlalchemy import (
+    select, and_, or_, func, distinct, update, delete, insert, column, bindparam, Integer, tuple_, ColumnElement,
+    Select, TableValuedAlias,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert, ARRAY
+from sqlalchemy.types import TypeEngine
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from db.session.base import Base
+from db.session.transactions import after_commit
 
 ModelType = TypeVar("ModelType", bound=Base)
-OrderByType = tuple[str, Literal["asc", "desc"]]
+OrderByType = tuple[str | ColumnElement, Literal["asc", "desc"]]
 
 
 class AbstractRepository(ABC):
@@ -15,6 +22,10 @@ class AbstractRepository(ABC):
     async def create_one(self, data: dict) -> ModelType:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, data: list[dict]) -> list[ModelType]:
+        raise NotImplementedError
+
     @abstractmethod
     async def find_all_with_filters(
             self,
@@ -23,14 +34,42 @@ class AbstractRepository(ABC):
             options: list | None = None,
             offset: int | None = None,
             limit: int | None = None,
-            order_by: OrderByType | None = None
+            order_by: OrderByType | None = None,
+            after: tuple | None = None,
+            columns: list[str] | None = None,
     ) -> list[ModelType]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream_all_with_filters(
+            self,
+            filters: list | None = None,
+            joins: dict | None = None,
+            options: list | None = None,
+            order_by: OrderByType | None = None,
+            columns: list[str] | None = None,
+            batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_facets(
+            self,
+            facets: dict[str, ColumnElement],
+            filters: list | None = None,
+            joins: dict | None = None,
+            outer_joins: list | None = None,
+    ) -> dict[str, dict[Any, int]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def find_all_by_field(self, field: str, values: list, options: list | None = None) -> dict[any, ModelType]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_similar_values(self, field: str, query: str, limit: int) -> list[Any]:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_one(self, item_id: int) -> bool:
         raise NotImplementedError
@@ -43,6 +82,19 @@ class AbstractRepository(ABC):
     async def update_one(self, item_id: int, data: dict) -> ModelType:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_many(self, data: list[dict]) -> list[ModelType]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert_many(
+            self,
+            data: list[dict],
+            constraint: str,
+            update_fields: list[str] | None = None,
+    ) -> list[ModelType]:
+        raise NotImplementedError
+
     @abstractmethod
     async def increment_field(
             self,
@@ -51,6 +103,19 @@ class AbstractRepository(ABC):
             delta: float) -> ModelType | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def increment_many(
+            self,
+            field: str,
+            deltas: dict[int, float],
+            min_value: float | None = None,
+    ) -> list[ModelType]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        raise NotImplementedError
+
 
 class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
     def __init__(self, model: Type[ModelType], session: AsyncSession):
@@ -62,6 +127,13 @@ class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    async def create_many(self, data: list[dict]) -> list[ModelType]:
+        if not data:
+            return []
+        stmt = insert(self._model).returning(self._model)
+        result = await self._session.execute(stmt, data)
+        return list(result.scalars().all())
+
     async def find_all_with_filters(
             self,
             filters: list | None = None,
@@ -70,32 +142,14 @@ class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
             offset: int | None = None,
             limit: int | None = None,
             order_by: OrderByType | None = None,
+            after: tuple | None = None,
+            columns: list[str] | None = None,
     ) -> list[ModelType]:
-        query = select(self._model)
-        if joins:
-            for relation, condition in joins.items():
-                if condition is True:
-                    query = query.join(getattr(self._model, relation))
-                else:
-                    query = query.join(getattr(self._model, relation)).where(condition)
-
-        if filters:
-            query = query.where(and_(*filters))
-
-        if order_by:
-            field, direction = order_by
-            field = getattr(self._model, field)
-            if direction == "asc":
-                query = query.order_by(field.asc())
-            else:
-                query = query.order_by(field.desc())
-        else:
-            query = query.order_by(self._model.id.desc())
-
-        if options:
-            for option in options:
-                query = query.options(option)
+        """Joins become EXISTS semi-joins, so pages never repeat or drop parent rows.
 
+        With columns, only those attributes are loaded; touching any other one raises.
+        """
+        query = self._filtered_query(filters, joins, options, order_by, after, columns)
         if offset is not None:
             query = query.offset(offset)
         if limit is not None:
@@ -104,6 +158,64 @@ class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
         result = await self._session.execute(query)
         return list(result.unique().scalars().all())
 
+    async def stream_all_with_filters(
+            self,
+            filters: list | None = None,
+            joins: dict | None = None,
+            options: list | None = None,
+            order_by: OrderByType | None = None,
+            columns: list[str] | None = None,
+            batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """Server-side cursor: rows arrive batch_size at a time, options must not be joined collections."""
+        query = self._filtered_query(filters, joins, options, order_by, None, columns)
+        result = await self._session.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for item in result:
+            yield item
+
+    async def count_facets(
+            self,
+            facets: dict[str, ColumnElement],
+            filters: list | None = None,
+            joins: dict | None = None,
+            outer_joins: list | None = None,
+    ) -> dict[str, dict[Any, int]]:
+        """Distinct row counts per value of every facet in one GROUPING SETS pass.
+
+        outer_joins takes relationship names or relationship attributes (e.g. with .and_() criteria).
+        """
+        query = select(
+            self._model.id.label("item_id"),
+            *(expression.label(name) for name, expression in facets.items()),
+        ).select_from(self._model)
+        query = self._apply_joins(query, joins)
+        for relation in outer_joins or []:
+            if not isinstance(relation, str):
+                query = query.outerjoin(relation)
+            elif not joins or relation not in joins:
+                query = query.outerjoin(getattr(self._model, relation))
+        if filters:
+            query = query.where(and_(*filters))
+        rows = query.subquery("facet_rows")
+
+        facet_columns = [rows.c[name] for name in facets]
+        query = (
+            select(
+                *facet_columns,
+                *(func.grouping(facet_column).label(f"{facet_column.name}_grouping") for facet_column in facet_columns),
+                func.count(distinct(rows.c.item_id)).label("count"),
+            )
+            .group_by(func.grouping_sets(*facet_columns))
+        )
+
+        counts = {name: {} for name in facets}
+        result = await self._session.execute(query)
+        for row in result.mappings():
+            for name in facets:
+                if row[f"{name}_grouping"] == 0 and row[name] is not None:
+                    counts[name][row[name]] = row["count"]
+        return counts
+
     async def find_all_by_field(self, field: str, values: list, options: list | None = None) -> dict[any, ModelType]:
         if not values:
             return {}
@@ -116,6 +228,20 @@ class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
         result = await self._session.execute(stmt)
         return {item.id: item for item in result.scalars()}
 
+    async def find_similar_values(self, field: str, query: str, limit: int) -> list[Any]:
+        """Distinct values of a text column, prefix matches first, then by trigram similarity."""
+        model_field = getattr(self._model, field)
+        is_prefix = model_field.istartswith(query, autoescape=True)
+        stmt = (
+            select(model_field)
+            .where(or_(is_prefix, model_field.bool_op("%")(query)))
+            .group_by(model_field)
+            .order_by(is_prefix.desc(), func.similarity(model_field, query).desc(), model_field)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
     async def delete_one(self, item_id: int) -> bool:
         stmt = delete(self._model).where(self._model.id == item_id)
         result = await self._session.execute(stmt)
@@ -139,6 +265,49 @@ class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    async def update_many(self, data: list[dict]) -> list[ModelType]:
+        """Every dict must contain "id" and the same set of fields to update."""
+        if not data:
+            return []
+        fields = [key for key in data[0] if key != "id"]
+        new_values = self._unnest("new_values", [
+            ("id", Integer(), [item["id"] for item in data]),
+            *((field, getattr(self._model, field).type, [item[field] for item in data]) for field in fields),
+        ])
+
+        stmt = (
+            update(self._model)
+            .where(self._model.id == new_values.c.id)
+            .values({field: new_values.c[field] for field in fields})
+            .returning(self._model)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def upsert_many(
+            self,
+            data: list[dict],
+            constraint: str,
+            update_fields: list[str] | None = None,
+    ) -> list[ModelType]:
+        if not data:
+            return []
+        if update_fields is None:
+            update_fields = [key for key in data[0] if key != "id"]
+
+        stmt = pg_insert(self._model)
+        if update_fields:
+            stmt = stmt.on_conflict_do_update(
+                constraint=constraint,
+                set_={field: stmt.excluded[field] for field in update_fields},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(constraint=constraint)
+        stmt = stmt.returning(self._model).execution_options(populate_existing=True)
+
+        result = await self._session.execute(stmt, data)
+        return list(result.scalars().all())
+
     async def increment_field(
             self,
             item_id: int,
@@ -158,3 +327,109 @@ class SQLAlchemyRepository(AbstractRepository, Generic[ModelType]):
 
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def increment_many(
+            self,
+            field: str,
+            deltas: dict[int, float],
+            min_value: float | None = None,
+    ) -> list[ModelType]:
+        """Rows that would drop below min_value are skipped and not returned.
+
+        Rows are locked in id order first, so concurrent calls over overlapping ids cannot deadlock.
+        """
+        if not deltas:
+            return []
+        await self._session.execute(
+            select(self._model.id)
+            .where(self._model.id.in_(sorted(deltas)))
+            .order_by(self._model.id)
+            .with_for_update()
+        )
+        model_field = getattr(self._model, field)
+        delta_values = self._unnest("deltas", [
+            ("id", Integer(), list(deltas)),
+            ("delta", model_field.type, list(deltas.values())),
+        ])
+        new_value = model_field + delta_values.c.delta
+
+        stmt = update(self._model).where(self._model.id == delta_values.c.id)
+        if min_value is not None:
+            stmt = stmt.where(new_value >= min_value)
+        stmt = stmt.values({field: new_value}).returning(self._model)
+
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        after_commit(self._session, callback)
+
+    @staticmethod
+    def _unnest(name: str, columns: list[tuple[str, TypeEngine, list]]) -> TableValuedAlias:
+        """Rows passed as one array parameter per column, so the compiled SQL is the same for any row count."""
+        return func.unnest(
+            *(bindparam(f"{name}_{column_name}", column_values, type_=ARRAY(column_type))
+              for column_name, column_type, column_values in columns)
+        ).table_valued(
+            *(column(column_name, column_type) for column_name, column_type, _ in columns)
+        ).render_derived(name=name)
+
+    def _filtered_query(
+            self,
+            filters: list | None,
+            joins: dict | None,
+            options: list | None,
+            order_by: OrderByType | None,
+            after: tuple | None,
+            columns: list[str] | None,
+    ) -> Select:
+        query = select(self._model)
+        if columns:
+            query = query.options(load_only(*(getattr(self._model, field) for field in columns), raiseload=True))
+        if joins:
+            query = query.where(*self._semi_join_filters(joins))
+
+        if filters:
+            query = query.where(and_(*filters))
+
+        if order_by:
+            field, direction = order_by
+            if isinstance(field, str):
+                field = getattr(self._model, field)
+            keyset = [field, self._model.id]
+        else:
+            direction = "desc"
+            keyset = [self._model.id]
+
+        if after is not None:
+            if direction == "asc":
+                query = query.where(tuple_(*keyset) > tuple(after))
+            else:
+                query = query.where(tuple_(*keyset) < tuple(after))
+
+        if direction == "asc":
+            query = query.order_by(*(field.asc() for field in keyset))
+        else:
+            query = query.order_by(*(field.desc() for field in keyset))
+
+        if options:
+            for option in options:
+                query = query.options(option)
+        return query
+
+    def _apply_joins(self, query: Select, joins: dict | None) -> Select:
+        if joins:
+            for relation, condition in joins.items():
+                if condition is True:
+                    query = query.join(getattr(self._model, relation))
+                else:
+                    query = query.join(getattr(self._model, relation)).where(condition)
+        return query
+
+    def _semi_join_filters(self, joins: dict) -> list:
+        semi_joins = []
+        for relation, condition in joins.items():
+            relationship = getattr(self._model, relation)
+            exists = relationship.any if relationship.property.uselist else relationship.has
+            semi_joins.append(exists() if condition is True else exists(condition))
+        return semi_joins
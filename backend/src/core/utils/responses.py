@@ -0,0 +1,23 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from starlette import status
+
+
+class JSONBytesResponse(Response):
+    media_type = "application/json"
+
+
+def json_bytes_response(
+        adapter: TypeAdapter,
+        content: Any,
+        status_code: int = status.HTTP_200_OK,
+        fields: list[str] | None = None,
+) -> JSONBytesResponse:
+    """Encode already-built read models straight to bytes, skipping response_model re-validation.
+
+    fields trims every item of a list payload to the given keys.
+    """
+    include = {"__all__": set(fields)} if fields else None
+    return JSONBytesResponse(content=adapter.dump_json(content, include=include), status_code=status_code)
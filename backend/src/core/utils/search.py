@@ -0,0 +1,17 @@
+from sqlalchemy import func, literal_column, ColumnElement
+
+SEARCH_CONFIG = "simple"
+# Rendered inline: a bound config would be sent as varchar, which has no implicit cast to regconfig
+_SEARCH_CONFIG_LITERAL = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+
+def websearch_query(search_query: str) -> ColumnElement:
+    return func.websearch_to_tsquery(_SEARCH_CONFIG_LITERAL, search_query)
+
+
+def matches(search_vector: ColumnElement, ts_query: ColumnElement) -> ColumnElement[bool]:
+    return search_vector.bool_op("@@")(ts_query)
+
+
+def rank(search_vector: ColumnElement, ts_query: ColumnElement) -> ColumnElement[float]:
+    return func.ts_rank(search_vector, ts_query)
@@ -0,0 +1,39 @@
+import fcntl
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+
+_COUNTER_FORMAT = "<Q"
+_COUNTER_SIZE = struct.calcsize(_COUNTER_FORMAT)
+
+
+class SharedCounter:
+    """A monotonic counter in a memory-mapped file, shared by every worker on the host."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked():
+            if os.fstat(self._fd).st_size < _COUNTER_SIZE:
+                os.ftruncate(self._fd, _COUNTER_SIZE)
+        self._map = mmap.mmap(self._fd, _COUNTER_SIZE)
+
+    @property
+    def value(self) -> int:
+        return struct.unpack_from(_COUNTER_FORMAT, self._map)[0]
+
+    def increment(self) -> int:
+        with self._locked():
+            value = self.value + 1
+            struct.pack_into(_COUNTER_FORMAT, self._map, 0, value)
+        return value
+
+    @contextmanager
+    def _locked(self):
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
@@ -0,0 +1,34 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+
+
+class StatementCacheStats:
+    """Counts how often executed statements were served from SQLAlchemy's compiled cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "after_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is None:
+            return
+        if context.cache_hit == CacheStats.CACHE_HIT:
+            self.hits += 1
+        elif context.cache_hit == CacheStats.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
+
+    def stats(self) -> dict:
+        cached = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_rate": self.hits / cached if cached else 0.0,
+        }
@@ -1,11 +1,14 @@
 from datetime import datetime
+from typing import Collection
 
-from sqlalchemy import ForeignKey, DateTime, func, Enum, CheckConstraint
+from sqlalchemy import ForeignKey, DateTime, func, Enum, CheckConstraint, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from db.session.base import Base
 from schemas.orders.orders import OrderStatus, OrderOut, OrderItemOut
 
+ORDER_READ_FIELDS = ["id", "user_id", "order_date", "status", "total_amount"]
+
 
 class Order(Base):
     __tablename__ = "orders"
@@ -27,28 +30,31 @@ class Order(Base):
 
     __table_args__ = (
         CheckConstraint("total_amount >= 0", name="check_order_total_amount"),
+        Index("ix_orders_user_id_order_date_id", "user_id", "order_date", "id"),
+        Index("ix_orders_user_id_id", "user_id", "id"),
     )
 
-    def to_read_model(self, include_items: bool = False) -> OrderOut:
-        return OrderOut(
-            id=self.id,
-            user_id=self.user_id,
-            order_date=self.order_date,
-            items=[item.to_read_model(include_sneaker_variant=True) for item in
-                   self.items] if include_items and self.items is not None else None,
-            status=self.status,
-            total_amount=self.total_amount,
-        )
+    def to_read_model(self, include_items: bool = False, fields: Collection[str] | None = None) -> OrderOut:
+        data = {
+            field: getattr(self, field)
+            for field in ORDER_READ_FIELDS
+            if fields is None or field in fields
+        }
+        if include_items and self.items is not None:
+            data["items"] = [item.to_read_model(include_sneaker_variant=True) for item in self.items]
+        return OrderOut.model_construct(**data)
 
 
 class OrderItem(Base):
     __tablename__ = "order_items"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id", ondelete="CASCADE"))
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id", ondelete="CASCADE"), index=True)
     quantity: Mapped[int] = mapped_column(default=1)
     price_at_time: Mapped[float] = mapped_column(default=0.0)
-    sneaker_variant_id: Mapped[int] = mapped_column(ForeignKey("sneaker_variants.id", ondelete="RESTRICT"))
+    sneaker_variant_id: Mapped[int] = mapped_column(
+        ForeignKey("sneaker_variants.id", ondelete="RESTRICT"), index=True
+    )
 
     sneaker_variant: Mapped["SneakerVariant"] = relationship(lazy="raise")
     order: Mapped["Order"] = relationship(back_populates="items")
@@ -59,7 +65,7 @@ class OrderItem(Base):
     )
 
     def to_read_model(self, include_sneaker_variant: bool = False) -> OrderItemOut:
-        return OrderItemOut(
+        return OrderItemOut.model_construct(
             id=self.id,
             order_id=self.order_id,
             quantity=self.quantity,
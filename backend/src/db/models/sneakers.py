@@ -1,10 +1,16 @@
-from sqlalchemy import ForeignKey, CheckConstraint, UniqueConstraint
+from typing import Collection
+
+from sqlalchemy import ForeignKey, CheckConstraint, UniqueConstraint, Index, Computed, Float, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, ARRAY
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
+from core.utils.search import SEARCH_CONFIG
 from db.session.base import Base
 from schemas.sneaker_model.sneaker_model import SneakerModelOut
 from schemas.sneaker_variant.sneaker_variant import SneakerVariantOut, SneakerVariantOutWithModel
 
+SNEAKER_MODEL_READ_FIELDS = ["id", "name", "brand", "type", "description", "price"]
+
 
 class SneakerModel(Base):
     __tablename__ = "sneaker_models"
@@ -16,6 +22,24 @@ class SneakerModel(Base):
     type: Mapped[str] = mapped_column(index=True)
     description: Mapped[str] = mapped_column()
     price: Mapped[float] = mapped_column(default=0.0)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    # Maintained by the sneaker_variants_refresh_model_stock trigger
+    total_stock: Mapped[int] = mapped_column(server_default="0")
+    available_sizes: Mapped[list[float]] = mapped_column(ARRAY(Float), server_default="{}")
+    in_stock: Mapped[bool] = mapped_column(Computed("total_stock > 0", persisted=True))
+    min_size: Mapped[float | None] = mapped_column(Computed("available_sizes[1]", persisted=True))
+    max_size: Mapped[float | None] = mapped_column(
+        Computed("available_sizes[cardinality(available_sizes)]", persisted=True)
+    )
 
     variants: Mapped[list["SneakerVariant"]] = relationship(
         "SneakerVariant",
@@ -27,20 +51,30 @@ class SneakerModel(Base):
     __table_args__ = (
         UniqueConstraint("name", name="uq_sneaker_model_name"),
         CheckConstraint("price >= 0", name="check_sneaker_model_price"),
+        Index("ix_sneaker_models_price_id", "price", "id"),
+        Index("ix_sneaker_models_brand_type_price_id", "brand", "type", "price", "id"),
+        Index("ix_sneaker_models_in_stock_price_id", "in_stock", "price", "id"),
+        Index("ix_sneaker_models_available_sizes", "available_sizes", postgresql_using="gin"),
+        Index("ix_sneaker_models_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_sneaker_models_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_sneaker_models_brand_trgm", "brand",
+            postgresql_using="gin", postgresql_ops={"brand": "gin_trgm_ops"},
+        ),
     )
 
-    def to_read_model(self, include_variants: bool = False) -> SneakerModelOut:
-        return SneakerModelOut(
-            id=self.id,
-            name=self.name,
-            brand=self.brand,
-            type=self.type,
-            description=self.description,
-            price=self.price,
-            variants=[variant.to_read_model() for variant in self.variants]
-            if include_variants and self.variants is not None
-            else None,
-        )
+    def to_read_model(self, include_variants: bool = False, fields: Collection[str] | None = None) -> SneakerModelOut:
+        data = {
+            field: getattr(self, field)
+            for field in SNEAKER_MODEL_READ_FIELDS
+            if fields is None or field in fields
+        }
+        if include_variants and self.variants is not None:
+            data["variants"] = [variant.to_read_model() for variant in self.variants]
+        return SneakerModelOut.model_construct(**data)
 
 
 class SneakerVariant(Base):
@@ -59,10 +93,11 @@ class SneakerVariant(Base):
     __table_args__ = (
         CheckConstraint("quantity >= 0", name="check_sneaker_variant_quantity"),
         UniqueConstraint('model_id', 'size', name='uq_model_size'),
+        Index("ix_sneaker_variants_model_id_size_in_stock", "model_id", "size", postgresql_where=text("quantity > 0")),
     )
 
     def to_read_model(self) -> SneakerVariantOut:
-        return SneakerVariantOut(
+        return SneakerVariantOut.model_construct(
             id=self.id,
             model_id=self.model_id,
             size=self.size,
@@ -70,7 +105,7 @@ class SneakerVariant(Base):
         )
 
     def to_read_model_with_name(self) -> SneakerVariantOutWithModel:
-        return SneakerVariantOutWithModel(
+        return SneakerVariantOutWithModel.model_construct(
             id=self.id,
             model_id=self.model_id,
             size=self.size,
@@ -5,7 +5,7 @@ from sqlalchemy import String, DateTime, func, UniqueConstraint
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from db.session.base import Base
-from schemas.users.users import UserOut
+from schemas.users.users import CurrentUser, UserOut
 
 
 class User(Base):
@@ -56,3 +56,12 @@ class User(Base):
             if include_orders and self.orders is not None
             else None,
         )
+
+    def to_current_user(self) -> CurrentUser:
+        return CurrentUser.model_construct(
+            id=self.id,
+            username=self.username,
+            is_superuser=self.is_superuser,
+            is_active=self.is_active,
+            is_verified=self.is_verified,
+        )
@@ -4,16 +4,20 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from core.config.config import settings
+from core.utils.statement_cache import StatementCacheStats
 
 
 class DatabaseHelper:
-    def __init__(self, url, echo, pool_size, max_overflow):
+    def __init__(self, url, echo, pool_size, max_overflow, query_cache_size):
         self.engine = create_async_engine(
             url=url,
             echo=echo,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            query_cache_size=query_cache_size,
         )
+        self.statement_cache_stats = StatementCacheStats()
+        self.statement_cache_stats.install(self.engine.sync_engine)
         self.async_session_maker = async_sessionmaker(
             self.engine,
             expire_on_commit=False,
@@ -43,6 +47,7 @@ db_helper = DatabaseHelper(
     echo=False,
     pool_size=20,
     max_overflow=10,
+    query_cache_size=settings.db_settings.DB_QUERY_CACHE_SIZE,
 )
 
 
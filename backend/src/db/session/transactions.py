@@ -0,0 +1,29 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run callback once the session's transaction commits; a rollback drops it.
+
+    Cache invalidation goes through here: done earlier, a concurrent reader could re-cache the
+    rows that are about to change under the new cache version.
+    """
+    callbacks = session.sync_session.info.setdefault(_AFTER_COMMIT_KEY, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
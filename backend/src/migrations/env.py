@@ -14,7 +14,9 @@ from db.models.sneakers import SneakerModel, SneakerVariant
 from db.models.orders import Order, OrderItem
 
 config = context.config
-config.set_main_option("sqlalchemy.url", f'postgresql+asyncpg://\
+# Callers such as the test suite may point alembic at another database
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", f'postgresql+asyncpg://\
 {settings.db_settings.DB_USER}:\
 {settings.db_settings.DB_PASSWORD}@\
 {settings.db_settings.DB_HOST}:\
@@ -0,0 +1,43 @@
+"""add query shape indexes
+
+Revision ID: 27b358fbf47c
+Revises: d2c7f1e08a35
+Create Date: 2026-10-18 21:05:37.114902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '27b358fbf47c'
+down_revision: Union[str, None] = 'd2c7f1e08a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_sneaker_models_brand_type_price_id', 'sneaker_models',
+                        ['brand', 'type', 'price', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_sneaker_variants_model_id_size_in_stock', 'sneaker_variants', ['model_id', 'size'],
+                        unique=False, postgresql_where=sa.text('quantity > 0'), postgresql_concurrently=True)
+        op.create_index('ix_orders_user_id_id', 'orders', ['user_id', 'id'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('ix_order_items_order_id', 'order_items', ['order_id'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('ix_order_items_sneaker_variant_id', 'order_items', ['sneaker_variant_id'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_order_items_sneaker_variant_id', table_name='order_items', postgresql_concurrently=True)
+        op.drop_index('ix_order_items_order_id', table_name='order_items', postgresql_concurrently=True)
+        op.drop_index('ix_orders_user_id_id', table_name='orders', postgresql_concurrently=True)
+        op.drop_index('ix_sneaker_variants_model_id_size_in_stock', table_name='sneaker_variants',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_sneaker_models_brand_type_price_id', table_name='sneaker_models',
+                      postgresql_concurrently=True)
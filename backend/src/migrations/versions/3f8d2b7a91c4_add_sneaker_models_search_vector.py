@@ -0,0 +1,38 @@
+"""add sneaker_models search_vector
+
+Revision ID: 3f8d2b7a91c4
+Revises: 7c1e9a4b2d6f
+Create Date: 2026-10-18 14:32:07.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8d2b7a91c4'
+down_revision: Union[str, None] = '7c1e9a4b2d6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sneaker_models', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index('ix_sneaker_models_search_vector', 'sneaker_models', ['search_vector'], unique=False,
+                    postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sneaker_models_search_vector', table_name='sneaker_models', postgresql_using='gin')
+    op.drop_column('sneaker_models', 'search_vector')
@@ -0,0 +1,26 @@
+"""add keyset pagination indexes
+
+Revision ID: 7c1e9a4b2d6f
+Revises: e3e0fefe06aa
+Create Date: 2026-10-18 12:10:42.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e9a4b2d6f'
+down_revision: Union[str, None] = 'e3e0fefe06aa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_sneaker_models_price_id', 'sneaker_models', ['price', 'id'], unique=False)
+    op.create_index('ix_orders_user_id_order_date_id', 'orders', ['user_id', 'order_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_user_id_order_date_id', table_name='orders')
+    op.drop_index('ix_sneaker_models_price_id', table_name='sneaker_models')
@@ -0,0 +1,29 @@
+"""add sneaker_models trigram indexes
+
+Revision ID: b5a04e6c3d19
+Revises: 3f8d2b7a91c4
+Create Date: 2026-10-18 16:05:51.227384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5a04e6c3d19'
+down_revision: Union[str, None] = '3f8d2b7a91c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_sneaker_models_name_trgm', 'sneaker_models', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_sneaker_models_brand_trgm', 'sneaker_models', ['brand'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'brand': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sneaker_models_brand_trgm', table_name='sneaker_models', postgresql_using='gin')
+    op.drop_index('ix_sneaker_models_name_trgm', table_name='sneaker_models', postgresql_using='gin')
@@ -0,0 +1,109 @@
+"""add sneaker_models stock summary
+
+Revision ID: d2c7f1e08a35
+Revises: b5a04e6c3d19
+Create Date: 2026-10-18 18:47:13.660512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c7f1e08a35'
+down_revision: Union[str, None] = 'b5a04e6c3d19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sneaker_models', sa.Column('total_stock', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('sneaker_models', sa.Column('available_sizes', postgresql.ARRAY(sa.Float()),
+                                              server_default='{}', nullable=False))
+    op.add_column('sneaker_models', sa.Column('in_stock', sa.Boolean(),
+                                              sa.Computed('total_stock > 0', persisted=True), nullable=False))
+    op.add_column('sneaker_models', sa.Column('min_size', sa.Float(),
+                                              sa.Computed('available_sizes[1]', persisted=True), nullable=True))
+    op.add_column('sneaker_models', sa.Column('max_size', sa.Float(),
+                                              sa.Computed('available_sizes[cardinality(available_sizes)]',
+                                                          persisted=True), nullable=True))
+
+    op.execute("""
+        UPDATE sneaker_models AS m
+        SET total_stock = s.total_stock,
+            available_sizes = s.available_sizes
+        FROM (
+            SELECT model_id,
+                   sum(quantity) AS total_stock,
+                   coalesce(array_agg(size ORDER BY size) FILTER (WHERE quantity > 0), '{}') AS available_sizes
+            FROM sneaker_variants
+            GROUP BY model_id
+        ) AS s
+        WHERE m.id = s.model_id
+    """)
+
+    op.execute("""
+        CREATE FUNCTION sneaker_variants_refresh_model_stock() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND NEW.model_id = OLD.model_id AND NEW.size = OLD.size THEN
+                IF NEW.quantity <> OLD.quantity THEN
+                    UPDATE sneaker_models
+                    SET total_stock = total_stock + NEW.quantity - OLD.quantity,
+                        available_sizes = CASE
+                            WHEN OLD.quantity = 0 AND NEW.quantity > 0
+                                THEN ARRAY(SELECT unnest(array_append(available_sizes, NEW.size)) ORDER BY 1)
+                            WHEN OLD.quantity > 0 AND NEW.quantity = 0
+                                THEN array_remove(available_sizes, OLD.size)
+                            ELSE available_sizes
+                        END
+                    WHERE id = NEW.model_id;
+                END IF;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE sneaker_models
+                SET total_stock = total_stock - OLD.quantity,
+                    available_sizes = array_remove(available_sizes, OLD.size)
+                WHERE id = OLD.model_id;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE sneaker_models
+                SET total_stock = total_stock + NEW.quantity,
+                    available_sizes = CASE
+                        WHEN NEW.quantity > 0
+                            THEN ARRAY(SELECT unnest(array_append(available_sizes, NEW.size)) ORDER BY 1)
+                        ELSE available_sizes
+                    END
+                WHERE id = NEW.model_id;
+            END IF;
+
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER sneaker_variants_refresh_model_stock
+        AFTER INSERT OR DELETE OR UPDATE OF model_id, size, quantity ON sneaker_variants
+        FOR EACH ROW EXECUTE FUNCTION sneaker_variants_refresh_model_stock()
+    """)
+
+    op.create_index('ix_sneaker_models_in_stock_price_id', 'sneaker_models', ['in_stock', 'price', 'id'],
+                    unique=False)
+    op.create_index('ix_sneaker_models_available_sizes', 'sneaker_models', ['available_sizes'], unique=False,
+                    postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sneaker_models_available_sizes', table_name='sneaker_models', postgresql_using='gin')
+    op.drop_index('ix_sneaker_models_in_stock_price_id', table_name='sneaker_models')
+    op.execute('DROP TRIGGER sneaker_variants_refresh_model_stock ON sneaker_variants')
+    op.execute('DROP FUNCTION sneaker_variants_refresh_model_stock()')
+    op.drop_column('sneaker_models', 'max_size')
+    op.drop_column('sneaker_models', 'min_size')
+    op.drop_column('sneaker_models', 'in_stock')
+    op.drop_column('sneaker_models', 'available_sizes')
+    op.drop_column('sneaker_models', 'total_stock')
@@ -0,0 +1,84 @@
+from typing import AsyncIterable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.session.transactions import after_commit
+
+STAGING_TABLE = "sneaker_import_staging"
+STAGING_COLUMNS = ["line", "name", "brand", "type", "description", "price", "size", "quantity"]
+
+
+class CatalogImportRepository:
+    """Loads a catalog feed into a temporary staging table and merges it with set-based upserts."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def create_staging(self) -> None:
+        await self._session.execute(text(f"""
+            CREATE TEMPORARY TABLE {STAGING_TABLE} (
+                line integer NOT NULL,
+                name text NOT NULL,
+                brand text NOT NULL,
+                type text NOT NULL,
+                description text NOT NULL,
+                price double precision NOT NULL,
+                size double precision,
+                quantity integer NOT NULL
+            ) ON COMMIT DROP
+        """))
+
+    async def copy_to_staging(self, records: AsyncIterable[tuple]) -> int:
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        status = await raw_connection.driver_connection.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+        )
+        return int(status.split()[-1])
+
+    async def merge_models(self) -> tuple[int, int]:
+        """Upsert one row per name (the last line wins); returns (inserted, updated)."""
+        result = await self._session.execute(text(f"""
+            WITH upserted AS (
+                INSERT INTO sneaker_models (name, brand, type, description, price)
+                SELECT DISTINCT ON (name) name, brand, type, description, price
+                FROM {STAGING_TABLE}
+                ORDER BY name, line DESC
+                ON CONFLICT ON CONSTRAINT uq_sneaker_model_name DO UPDATE
+                SET brand = EXCLUDED.brand,
+                    type = EXCLUDED.type,
+                    description = EXCLUDED.description,
+                    price = EXCLUDED.price
+                WHERE (sneaker_models.brand, sneaker_models.type, sneaker_models.description, sneaker_models.price)
+                    IS DISTINCT FROM (EXCLUDED.brand, EXCLUDED.type, EXCLUDED.description, EXCLUDED.price)
+                RETURNING xmax = 0 AS inserted
+            )
+            SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted
+        """))
+        inserted, updated = result.one()
+        return inserted, updated
+
+    async def merge_variants(self) -> tuple[int, int]:
+        """Upsert one row per (model, size); unchanged quantities are not rewritten."""
+        result = await self._session.execute(text(f"""
+            WITH upserted AS (
+                INSERT INTO sneaker_variants (model_id, size, quantity)
+                SELECT DISTINCT ON (sneaker_models.id, staging.size)
+                    sneaker_models.id, staging.size, staging.quantity
+                FROM {STAGING_TABLE} AS staging
+                JOIN sneaker_models ON sneaker_models.name = staging.name
+                WHERE staging.size IS NOT NULL
+                ORDER BY sneaker_models.id, staging.size, staging.line DESC
+                ON CONFLICT ON CONSTRAINT uq_model_size DO UPDATE
+                SET quantity = EXCLUDED.quantity
+                WHERE sneaker_variants.quantity IS DISTINCT FROM EXCLUDED.quantity
+                RETURNING xmax = 0 AS inserted
+            )
+            SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted
+        """))
+        inserted, updated = result.one()
+        return inserted, updated
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        after_commit(self._session, callback)
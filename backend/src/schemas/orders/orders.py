@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 
 from schemas.sneaker_variant.sneaker_variant import SneakerVariantOut, SneakerVariantOutWithModel
 
+OrderField = Literal["id", "user_id", "items", "order_date", "status", "total_amount"]
+
 
 class OrderStatus(PyEnum):
     PENDING = "pending"
@@ -60,3 +62,10 @@ class OrderParams(BaseModel):
     offset: int | None = None
     limit: int | None = None
     sort_by_date: Literal["asc", "desc"] | None = None
+    cursor: str | None = None
+    fields: list[OrderField] | None = None
+
+
+class OrderPage(BaseModel):
+    items: list[OrderOut]
+    next_cursor: str | None = None
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 
+from core.utils.export import ExportFormat
+
 from schemas.orders.orders import OrderItemCreate, OrderParams
 
 
@@ -22,3 +24,8 @@ class GetOrdersInput(BaseModelWithConfig):
 class CancelOrderInput(BaseModelWithConfig):
     user_id: int
     order_id: int
+
+
+class ExportOrdersInput(BaseModelWithConfig):
+    export_format: ExportFormat
+    user_id: int | None = None
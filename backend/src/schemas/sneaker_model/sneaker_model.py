@@ -2,6 +2,8 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+SneakerModelField = Literal["id", "name", "brand", "type", "description", "price", "variants"]
+
 
 class SneakerModelBase(BaseModel):
     name: str
@@ -42,8 +44,70 @@ class SneakerModelParams(BaseModel):
     offset: int | None = None
     limit: int | None = None
     sort_by_price: Literal["asc", "desc"] | None = None
+    sort_by_relevance: bool | None = None
+    cursor: str | None = None
+    fields: list[SneakerModelField] | None = None
+
+
+class SneakerModelSuggestions(BaseModel):
+    names: list[str]
+    brands: list[str]
+
+
+class FacetCount(BaseModel):
+    value: str | float
+    count: int
+
+
+class PriceBucketCount(BaseModel):
+    min_price: float | None = None
+    max_price: float | None = None
+    count: int
+
+
+class SneakerModelFacets(BaseModel):
+    brands: list[FacetCount]
+    types: list[FacetCount]
+    sizes: list[FacetCount]
+    price_buckets: list[PriceBucketCount]
+
+
+class SneakerModelFacetsOut(BaseModel):
+    facets: SneakerModelFacets
+    items: list[SneakerModelOut] | None = None
+
+
+class SneakerModelPage(BaseModel):
+    items: list[SneakerModelOut]
+    next_cursor: str | None = None
+    # Already-encoded JSON array of the page (catalog engine); items is left empty when it is set
+    items_json: bytes | None = None
+
+
+ImportFormat = Literal["csv", "jsonl"]
+
+
+class SneakerModelImportRow(SneakerModelBase):
+    size: float | None = Field(None, gt=0)
+    quantity: int = Field(0, ge=0)
+
+
+class ImportRowError(BaseModel):
+    line: int
+    message: str
+
+
+class SneakerModelImportReport(BaseModel):
+    rows_staged: int
+    models_inserted: int
+    models_updated: int
+    variants_inserted: int
+    variants_updated: int
+    errors: list[ImportRowError]
 
 
 from schemas.sneaker_variant.sneaker_variant import SneakerVariantOut
 
 SneakerModelOut.model_rebuild()
+SneakerModelPage.model_rebuild()
+SneakerModelFacetsOut.model_rebuild()
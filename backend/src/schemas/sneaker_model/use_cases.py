@@ -1,6 +1,11 @@
+from typing import Iterable
+
 from pydantic import BaseModel
 
+from core.utils.export import ExportFormat
+
 from schemas.sneaker_model.sneaker_model import (
+    ImportFormat,
     SneakerModelCreate,
     SneakerModelParams,
     SneakerModelUpdate,
@@ -21,6 +26,11 @@ class GetSneakersModelsInput(BaseModelWithConfig):
     params: SneakerModelParams
 
 
+class GetSneakerModelsFacetsInput(BaseModelWithConfig):
+    params: SneakerModelParams
+    include_results: bool = False
+
+
 class UpdateSneakerModelInput(BaseModelWithConfig):
     sneaker_model_id: int
     update_sneaker_model: SneakerModelUpdate
@@ -28,3 +38,18 @@ class UpdateSneakerModelInput(BaseModelWithConfig):
 
 class DeleteSneakerModelInput(BaseModelWithConfig):
     sneaker_model_id: int
+
+
+class SuggestSneakerModelsInput(BaseModelWithConfig):
+    query: str
+    limit: int
+
+
+class ExportSneakerModelsInput(BaseModelWithConfig):
+    export_format: ExportFormat
+    include_variants: bool = False
+
+
+class ImportSneakerModelsInput(BaseModelWithConfig):
+    lines: Iterable[str]
+    import_format: ImportFormat
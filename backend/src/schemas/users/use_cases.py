@@ -19,6 +19,7 @@ class VerifyEmailInput(BaseModelWithConfig):
 
 class GetUserInput(BaseModelWithConfig):
     user_id: int
+    include_orders: bool = True
 
 
 class DeleteUserInput(BaseModelWithConfig):
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from schemas.orders.orders import OrderOut
 
@@ -28,6 +28,17 @@ class UserOut(UserBase):
     orders: list[OrderOut] | None = None
 
 
+class CurrentUser(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    username: str
+
+    is_superuser: bool
+    is_active: bool
+    is_verified: bool
+
+
 class ChangePasswordRequest(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8)
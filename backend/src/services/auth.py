@@ -5,7 +5,7 @@ from core.exceptions import (
     InactiveUserException,
     UnverifiedEmailException,
 )
-from core.utils.password import verify_password
+from core.utils.password import password_hasher
 from schemas.auth.auth import LoginRequest, TokenResponse
 from services.jwt import TokenService
 from services.users import UserService
@@ -23,7 +23,7 @@ class AuthService:
     async def authenticate_user(self, credentials: LoginRequest) -> TokenResponse:
         user = await self.user_service.get_user_by_username(credentials.username)
 
-        if not self._verify_password(credentials.password, user.password):
+        if not await self._verify_password(credentials.password, user.password):
             raise InvalidCredentialsException()
         if not user.is_active:
             raise InactiveUserException()
@@ -44,5 +44,5 @@ class AuthService:
         return await self.token_service.create_tokens(user)
 
     @staticmethod
-    def _verify_password(plain_password: str, hashed_password: str) -> bool:
-        return verify_password(plain_password, hashed_password)
+    async def _verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
@@ -0,0 +1,49 @@
+import uuid
+
+from core.config.config import settings
+from core.utils.cache import TTLCache
+from core.utils.shared_counter import SharedCounter
+
+catalog_cache = TTLCache(
+    maxsize=settings.catalog_settings.CATALOG_CACHE_SIZE,
+    ttl=settings.catalog_settings.CATALOG_CACHE_TTL_SECONDS,
+)
+suggestions_cache = TTLCache(
+    maxsize=settings.catalog_settings.SUGGEST_CACHE_SIZE,
+    ttl=settings.catalog_settings.SUGGEST_CACHE_TTL_SECONDS,
+)
+
+
+class CatalogVersion:
+    def __init__(self, counter: SharedCounter | None = None):
+        self._counter = counter
+        self._value = 0
+        self.boot_id = "shared" if counter is not None else uuid.uuid4().hex[:8]
+
+    @property
+    def value(self) -> int:
+        if self._counter is not None:
+            return self._counter.value
+        return self._value
+
+    def bump(self) -> None:
+        if self._counter is not None:
+            self._counter.increment()
+        else:
+            self._value += 1
+
+    def __str__(self) -> str:
+        return f"{self.boot_id}-{self.value}"
+
+
+catalog_version = CatalogVersion(
+    SharedCounter(settings.catalog_settings.CATALOG_SNAPSHOT_DIR / "catalog.generation")
+    if settings.catalog_settings.CATALOG_SNAPSHOT_DIR is not None
+    else None
+)
+
+
+def invalidate_catalog() -> None:
+    catalog_version.bump()
+    catalog_cache.clear()
+    suggestions_cache.clear()
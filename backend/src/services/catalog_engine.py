@@ -0,0 +1,282 @@
+import asyncio
+import fcntl
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Literal, NamedTuple, Sequence
+
+from core.config.config import settings
+from core.exceptions import InvalidCursorException
+from db.models.sneakers import SneakerModel
+from services.catalog_cache import catalog_version
+from services.catalog_snapshot import CatalogSnapshot, write_snapshot
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CatalogKeyset(NamedTuple):
+    id: int
+    price: float
+
+
+class CatalogIndex:
+    """Filter arrays plus every item pre-serialized as JSON, so pages are sliced, not re-encoded."""
+
+    def __init__(
+            self,
+            ids: "np.ndarray",
+            prices: "np.ndarray",
+            brands: dict[str, int],
+            brand_codes: "np.ndarray",
+            types: dict[str, int],
+            type_codes: "np.ndarray",
+            positions_by_name: dict[str, int],
+            size_columns: dict[float, int],
+            available_sizes: "np.ndarray",
+            items: Sequence[bytes],
+            items_with_variants: Sequence[bytes],
+            snapshot: CatalogSnapshot | None = None,
+    ):
+        self.ids = ids
+        self.prices = prices
+        self.brands = brands
+        self.brand_codes = brand_codes
+        self.types = types
+        self.type_codes = type_codes
+        self.positions_by_name = positions_by_name
+        self.size_columns = size_columns
+        self.available_sizes = available_sizes
+        self.in_stock = available_sizes.any(axis=1)
+        self.items = items
+        self.items_with_variants = items_with_variants
+        self._snapshot = snapshot
+
+    @classmethod
+    def from_models(cls, sneakers_models: list[SneakerModel]) -> "CatalogIndex":
+        count = len(sneakers_models)
+        brands, brand_codes = cls._encode([m.brand for m in sneakers_models])
+        types, type_codes = cls._encode([m.type for m in sneakers_models])
+
+        sizes = sorted({variant.size for m in sneakers_models for variant in m.variants})
+        size_columns = {size: column for column, size in enumerate(sizes)}
+        available_sizes = np.zeros((count, len(sizes)), dtype=bool)
+        for position, sneaker_model in enumerate(sneakers_models):
+            for variant in sneaker_model.variants:
+                if variant.quantity > 0:
+                    available_sizes[position, size_columns[variant.size]] = True
+
+        return cls(
+            ids=np.fromiter((m.id for m in sneakers_models), dtype=np.int64, count=count),
+            prices=np.fromiter((m.price for m in sneakers_models), dtype=np.float64, count=count),
+            brands=brands,
+            brand_codes=brand_codes,
+            types=types,
+            type_codes=type_codes,
+            positions_by_name={m.name: position for position, m in enumerate(sneakers_models)},
+            size_columns=size_columns,
+            available_sizes=available_sizes,
+            items=[m.to_read_model().model_dump_json().encode() for m in sneakers_models],
+            items_with_variants=[
+                m.to_read_model(include_variants=True).model_dump_json().encode() for m in sneakers_models
+            ],
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot) -> "CatalogIndex":
+        meta = snapshot.meta
+        return cls(
+            ids=snapshot.array("ids"),
+            prices=snapshot.array("prices"),
+            brands={brand: code for code, brand in enumerate(meta["brands"])},
+            brand_codes=snapshot.array("brand_codes"),
+            types={sneaker_model_type: code for code, sneaker_model_type in enumerate(meta["types"])},
+            type_codes=snapshot.array("type_codes"),
+            positions_by_name=meta["positions_by_name"],
+            size_columns={size: column for column, size in enumerate(meta["sizes"])},
+            available_sizes=snapshot.array("available_sizes"),
+            items=_SnapshotItems(snapshot, include_variants=False),
+            items_with_variants=_SnapshotItems(snapshot, include_variants=True),
+            snapshot=snapshot,
+        )
+
+    @staticmethod
+    def _encode(values: list[str]) -> tuple[dict[str, int], "np.ndarray"]:
+        codes = {}
+        encoded = np.fromiter((codes.setdefault(value, len(codes)) for value in values), dtype=np.int32,
+                              count=len(values))
+        return codes, encoded
+
+    def find(
+            self,
+            sneaker_model_id: int | None = None,
+            name: str | None = None,
+            brand: str | None = None,
+            sneaker_model_type: str | None = None,
+            min_price: float | None = None,
+            max_price: float | None = None,
+            sizes: list[float] | None = None,
+            include_variants: bool = False,
+            in_stock: bool | None = None,
+            offset: int | None = None,
+            limit: int | None = None,
+            sort_by_price: Literal["asc", "desc"] | None = None,
+            after: tuple | None = None,
+    ) -> "np.ndarray":
+        """Positions of the matching items, in page order."""
+        mask = np.ones(len(self.ids), dtype=bool)
+
+        if sneaker_model_id:
+            mask &= self.ids == sneaker_model_id
+        if name:
+            mask &= self._positions_mask(self.positions_by_name.get(name))
+        if brand:
+            mask &= self.brand_codes == self.brands.get(brand, -1)
+        if sneaker_model_type:
+            mask &= self.type_codes == self.types.get(sneaker_model_type, -1)
+        if min_price is not None:
+            mask &= self.prices >= min_price
+        if max_price is not None:
+            mask &= self.prices <= max_price
+        if sizes:
+            columns = [self.size_columns[size] for size in sizes if size in self.size_columns]
+            mask &= self.available_sizes[:, columns].any(axis=1)
+        if in_stock is not None:
+            mask &= self.in_stock == in_stock
+
+        if after is not None:
+            mask &= self._keyset_mask(sort_by_price, after)
+
+        positions = np.flatnonzero(mask)
+        if sort_by_price:
+            order = np.lexsort((self.ids[positions], self.prices[positions]))
+            if sort_by_price == "desc":
+                order = order[::-1]
+        else:
+            order = np.argsort(-self.ids[positions], kind="stable")
+        positions = positions[order]
+
+        start = offset or 0
+        stop = start + limit if limit is not None else None
+        return positions[start:stop]
+
+    def items_json(self, positions: "np.ndarray", include_variants: bool = False) -> list[bytes]:
+        items = self.items_with_variants if include_variants else self.items
+        return [items[position] for position in positions]
+
+    def keyset(self, position: int) -> CatalogKeyset:
+        return CatalogKeyset(id=int(self.ids[position]), price=float(self.prices[position]))
+
+    def close(self) -> None:
+        """Release the snapshot mapping; arrays must not be used afterwards."""
+        if self._snapshot is None:
+            return
+        self.ids = self.prices = self.brand_codes = self.type_codes = None
+        self.available_sizes = self.in_stock = None
+        self.items = self.items_with_variants = None
+        self._snapshot.close()
+        self._snapshot = None
+
+    def _positions_mask(self, position: int | None) -> "np.ndarray":
+        mask = np.zeros(len(self.ids), dtype=bool)
+        if position is not None:
+            mask[position] = True
+        return mask
+
+    def _keyset_mask(self, sort_by_price: Literal["asc", "desc"] | None, after: tuple) -> "np.ndarray":
+        if sort_by_price:
+            if len(after) != 2:
+                raise InvalidCursorException()
+            price, item_id = after
+            if sort_by_price == "asc":
+                return (self.prices > price) | ((self.prices == price) & (self.ids > item_id))
+            return (self.prices < price) | ((self.prices == price) & (self.ids < item_id))
+        return self.ids < after[0]
+
+
+class _SnapshotItems(Sequence[bytes]):
+    def __init__(self, snapshot: CatalogSnapshot, include_variants: bool):
+        self._snapshot = snapshot
+        self._include_variants = include_variants
+
+    def __len__(self) -> int:
+        return self._snapshot.meta["count"]
+
+    def __getitem__(self, position: int) -> bytes:
+        return self._snapshot.item_bytes(position, self._include_variants)
+
+
+class CatalogEngine:
+    def __init__(self, max_age: float, snapshot_dir: Path | None = None):
+        self.max_age = max_age
+        self.snapshot_path = snapshot_dir / "catalog.snapshot" if snapshot_dir else None
+        self._index: CatalogIndex | None = None
+        self._version: int | None = None
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_current(self, version: int | None, built_at: float) -> bool:
+        return version == catalog_version.value and time.time() - built_at < self.max_age
+
+    def _is_fresh(self) -> bool:
+        return self._index is not None and self._is_current(self._version, self._built_at)
+
+    async def get_index(self, loader: Callable[[], Awaitable[list[SneakerModel]]]) -> CatalogIndex:
+        if self._is_fresh():
+            return self._index
+        async with self._lock:
+            if not self._is_fresh():
+                previous_index = self._index
+                if self.snapshot_path is None:
+                    version = catalog_version.value
+                    self._index = CatalogIndex.from_models(await loader())
+                    self._version = version
+                    self._built_at = time.time()
+                else:
+                    snapshot = await self._get_snapshot(loader)
+                    self._index = CatalogIndex.from_snapshot(snapshot)
+                    self._version = snapshot.generation
+                    self._built_at = snapshot.built_at
+                # Callers use an index synchronously right after get_index, so nobody still holds this one
+                if previous_index is not None:
+                    previous_index.close()
+        return self._index
+
+    def _open_current_snapshot(self) -> CatalogSnapshot | None:
+        try:
+            snapshot = CatalogSnapshot(self.snapshot_path)
+        except (FileNotFoundError, ValueError):
+            return None
+        if not self._is_current(snapshot.generation, snapshot.built_at):
+            snapshot.close()
+            return None
+        return snapshot
+
+    async def _get_snapshot(self, loader: Callable[[], Awaitable[list[SneakerModel]]]) -> CatalogSnapshot:
+        snapshot = self._open_current_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        with open(self.snapshot_path.with_suffix(".lock"), "w") as lock_file:
+            await asyncio.to_thread(fcntl.flock, lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                snapshot = self._open_current_snapshot()
+                if snapshot is None:
+                    version = catalog_version.value
+                    index = CatalogIndex.from_models(await loader())
+                    await asyncio.to_thread(write_snapshot, self.snapshot_path, version, index)
+                    snapshot = CatalogSnapshot(self.snapshot_path)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        return snapshot
+
+
+catalog_engine: CatalogEngine | None = None
+if settings.catalog_settings.CATALOG_ENGINE_ENABLED:
+    if np is None:
+        raise RuntimeError("CATALOG_ENGINE_ENABLED requires numpy: poetry install --extras catalog-engine")
+    catalog_engine = CatalogEngine(
+        max_age=settings.catalog_settings.CATALOG_CACHE_TTL_SECONDS,
+        snapshot_dir=settings.catalog_settings.CATALOG_SNAPSHOT_DIR,
+    )
@@ -0,0 +1,90 @@
+import csv
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+from pydantic import ValidationError
+from starlette.concurrency import iterate_in_threadpool
+
+from repositories.catalog_import import CatalogImportRepository
+from schemas.sneaker_model.sneaker_model import (
+    ImportFormat,
+    ImportRowError,
+    SneakerModelImportReport,
+    SneakerModelImportRow,
+)
+from services.catalog_cache import invalidate_catalog
+
+PARSE_BATCH_SIZE = 1000
+
+
+class CatalogImportService:
+    def __init__(self, catalog_import_repo_factory: Callable[[], CatalogImportRepository]):
+        self._catalog_import_repo = catalog_import_repo_factory()
+
+    @staticmethod
+    def _parse_rows(lines: Iterable[str], import_format: ImportFormat) -> Iterator[tuple[int, dict | str]]:
+        if import_format == "csv":
+            reader = csv.DictReader(lines)
+            for row in reader:
+                yield reader.line_num, {
+                    key: value for key, value in row.items() if key is not None and value not in ("", None)
+                }
+        else:
+            for line_number, line in enumerate(lines, start=1):
+                if line.strip():
+                    yield line_number, line
+
+    @staticmethod
+    def _validate_row(payload: dict | str) -> SneakerModelImportRow:
+        if isinstance(payload, str):
+            return SneakerModelImportRow.model_validate_json(payload)
+        return SneakerModelImportRow.model_validate(payload)
+
+    def _parse_batches(
+            self, lines: Iterable[str], import_format: ImportFormat, errors: list[ImportRowError]
+    ) -> Iterator[list[tuple]]:
+        batch = []
+        for line_number, payload in self._parse_rows(lines, import_format):
+            try:
+                row = self._validate_row(payload)
+            except ValidationError as e:
+                errors.append(ImportRowError(
+                    line=line_number,
+                    message="; ".join(
+                        f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()
+                    ),
+                ))
+                continue
+            batch.append(
+                (line_number, row.name, row.brand, row.type, row.description, row.price, row.size, row.quantity)
+            )
+            if len(batch) >= PARSE_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def import_sneakers_models(
+            self, lines: Iterable[str], import_format: ImportFormat
+    ) -> SneakerModelImportReport:
+        errors: list[ImportRowError] = []
+
+        async def records() -> AsyncIterator[tuple]:
+            # lines may be a blocking file (the spooled upload); read and validate it off the event loop
+            async for batch in iterate_in_threadpool(self._parse_batches(lines, import_format, errors)):
+                for record in batch:
+                    yield record
+
+        await self._catalog_import_repo.create_staging()
+        rows_staged = await self._catalog_import_repo.copy_to_staging(records())
+        models_inserted, models_updated = await self._catalog_import_repo.merge_models()
+        variants_inserted, variants_updated = await self._catalog_import_repo.merge_variants()
+
+        self._catalog_import_repo.after_commit(invalidate_catalog)
+        return SneakerModelImportReport(
+            rows_staged=rows_staged,
+            models_inserted=models_inserted,
+            models_updated=models_updated,
+            variants_inserted=variants_inserted,
+            variants_updated=variants_updated,
+            errors=errors,
+        )
@@ -0,0 +1,93 @@
+import io
+import json
+import mmap
+import os
+import struct
+import time
+from math import prod
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SNAPSHOT_MAGIC = b"RVNCAT01"
+_HEADER = struct.Struct("<8sQdQ")
+_ALIGNMENT = 8
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view of a catalog snapshot file shared by all workers."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.generation, self.built_at, meta_length = _HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a catalog snapshot")
+        self.meta = json.loads(self._map[_HEADER.size:_HEADER.size + meta_length])
+        self._data_offset = _align(_HEADER.size + meta_length)
+
+    def array(self, name: str) -> "np.ndarray":
+        offset, dtype, shape = self.meta["sections"][name]
+        return np.frombuffer(
+            self._map, dtype=dtype, count=prod(shape), offset=self._data_offset + offset
+        ).reshape(shape)
+
+    def close(self) -> None:
+        try:
+            self._map.close()
+        except BufferError:
+            # An array() view is still referenced; the mapping is released when it is collected
+            pass
+
+    def item_bytes(self, position: int, include_variants: bool = False) -> bytes:
+        offset, length = self.meta["items_with_variants" if include_variants else "items"][position]
+        start = self._data_offset + offset
+        return self._map[start:start + length]
+
+
+def write_snapshot(path: Path, generation: int, index) -> None:
+    """Serialize a CatalogIndex to `path`; the file is swapped in atomically."""
+    data = io.BytesIO()
+    sections = {}
+    for name in ("ids", "prices", "brand_codes", "type_codes", "available_sizes"):
+        array = np.ascontiguousarray(getattr(index, name))
+        data.seek(_align(data.tell()))
+        sections[name] = [data.tell(), array.dtype.str, list(array.shape)]
+        data.write(array.tobytes())
+
+    def write_items(items) -> list[list[int]]:
+        offsets = []
+        for payload in items:
+            offsets.append([data.tell(), len(payload)])
+            data.write(payload)
+        return offsets
+
+    meta = json.dumps({
+        "count": len(index.ids),
+        "brands": list(index.brands),
+        "types": list(index.types),
+        "positions_by_name": index.positions_by_name,
+        "sizes": list(index.size_columns),
+        "sections": sections,
+        "items": write_items(index.items),
+        "items_with_variants": write_items(index.items_with_variants),
+    }).encode()
+
+    header = _HEADER.pack(SNAPSHOT_MAGIC, generation, time.time(), len(meta))
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(header)
+        file.write(meta)
+        file.write(b"\0" * (_align(len(header) + len(meta)) - len(header) - len(meta)))
+        file.write(data.getbuffer())
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
@@ -1,19 +1,42 @@
+import hashlib
+import time
 from datetime import timedelta, datetime, UTC
 
 from core.config.config import settings
 from core.exceptions import InvalidCredentialsException, TokenExpiredException
+from core.utils.cache import TTLCache
+from core.utils.jwt_keys import JWTKeyManager
 from db.models.users import User
 from schemas.auth.auth import TokenResponse
 
 import jwt
 
 
+jwt_key_manager = JWTKeyManager(
+    algorithm=settings.auth_jwt.algorithm,
+    private_key_path=settings.auth_jwt.private_key_path,
+    public_key_path=settings.auth_jwt.public_key_path,
+    verification_keys_dir=settings.auth_jwt.verification_keys_dir,
+    key_id=settings.auth_jwt.key_id,
+    reload_interval=settings.auth_jwt.key_reload_interval_seconds,
+)
+
+# Verified payloads keyed by token digest; an entry never outlives the token's exp.
+# max_ttl also bounds how long a token signed by a since-removed key keeps passing.
+verified_token_cache = TTLCache(
+    maxsize=settings.auth_jwt.token_cache_size if settings.auth_jwt.token_cache_enabled else 0,
+    ttl=settings.auth_jwt.token_cache_max_ttl_seconds,
+)
+
+
 class TokenService:
-    def __init__(self):
-        with open(settings.auth_jwt.private_key_path, "r") as f:
-            self.private_key = f.read()
-        with open(settings.auth_jwt.public_key_path, "r") as f:
-            self.public_key = f.read()
+    def __init__(
+            self,
+            key_manager: JWTKeyManager = jwt_key_manager,
+            token_cache: TTLCache = verified_token_cache,
+    ):
+        self.key_manager = key_manager
+        self.token_cache = token_cache
 
     async def create_tokens(self, user: User) -> TokenResponse:
         access_token = await self._create_token(
@@ -37,17 +60,34 @@ class TokenService:
         return verification_token
 
     async def verify_token(self, token: str) -> dict:
+        digest = None
+        if self.token_cache.maxsize > 0:
+            digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+            payload = self.token_cache.get(digest)
+            if payload is not None:
+                return dict(payload)
+
         try:
-            return jwt.decode(
+            verification_key = self.key_manager.verification_key(jwt.get_unverified_header(token).get("kid"))
+            if verification_key is None:
+                raise InvalidCredentialsException()
+            public_key, algorithm = verification_key
+            payload = jwt.decode(
                 token,
-                self.public_key,
-                algorithms=[settings.auth_jwt.algorithm],
+                public_key,
+                algorithms=[algorithm],
             )
         except jwt.ExpiredSignatureError:
             raise TokenExpiredException()
         except jwt.InvalidTokenError:
             raise InvalidCredentialsException()
 
+        if digest is not None and "exp" in payload:
+            ttl = payload["exp"] - time.time()
+            if ttl > 0:
+                self.token_cache.set(digest, dict(payload), ttl=ttl)
+        return payload
+
     async def get_username_from_token_payload(self, payload: dict) -> str:
         username = payload.get("sub")
         return username
@@ -60,6 +100,7 @@ class TokenService:
             "exp": expire,
             "sub": getattr(user, sub_type),
         }
+        kid, private_key = self.key_manager.signing_key()
         return jwt.encode(
-            to_encode, self.private_key, algorithm=settings.auth_jwt.algorithm
+            to_encode, private_key, algorithm=self.key_manager.algorithm, headers={"kid": kid}
         )
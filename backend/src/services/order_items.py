@@ -17,11 +17,12 @@ class OrderItemService:
     ):
         raise ItemNotFoundException("SneakerVariant", field, value)
 
-    async def create_order_item(self, order_item: OrderItemCreateInDB) -> OrderItem:
-        order_item_dict = order_item.model_dump()
+    async def create_order_items(self, order_items: list[OrderItemCreateInDB]) -> list[OrderItem]:
+        order_items_dicts = [order_item.model_dump() for order_item in order_items]
         try:
-            order_item = await self.order_item_repo.create_one(order_item_dict)
-            return order_item
+            return await self.order_item_repo.create_many(order_items_dicts)
         except IntegrityError as e:
             if "foreign key" in str(e).lower():
-                await self._handle_foreign_key_violation("id", str(order_item.sneaker_variant_id))
+                variant_ids = ", ".join(str(item.sneaker_variant_id) for item in order_items)
+                await self._handle_foreign_key_violation("id", variant_ids)
+            raise
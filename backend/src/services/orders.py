@@ -1,15 +1,27 @@
-from typing import Callable, Literal
+from typing import Callable, Literal, AsyncIterator
 
-from sqlalchemy import or_, and_
+from sqlalchemy import and_
 from sqlalchemy.orm import selectinload
 
 from core.exceptions import InsufficientPermissionsException, ItemNotFoundException
+from core.utils.pagination import parse_cursor
 from core.utils.repository import AbstractRepository
+from core.utils.search import websearch_query, matches
 from db.models import SneakerVariant, SneakerModel
-from db.models.orders import Order, OrderItem
+from db.models.orders import ORDER_READ_FIELDS, Order, OrderItem
+from db.models.sneakers import SNEAKER_MODEL_READ_FIELDS
 from schemas.orders.orders import OrderCreate, OrderStatus
 
 
+def _order_items_loader():
+    return (
+        selectinload(Order.items)
+        .joinedload(OrderItem.sneaker_variant)
+        .joinedload(SneakerVariant.model)
+        .load_only(*(getattr(SneakerModel, field) for field in SNEAKER_MODEL_READ_FIELDS), raiseload=True)
+    )
+
+
 class OrderService:
     def __init__(self, order_repo_factory: Callable[[], AbstractRepository]):
         self._order_repo = order_repo_factory()
@@ -29,11 +41,20 @@ class OrderService:
             search_query: str | None = None,
             offset: int | None = None,
             limit: int | None = None,
-            sort_by_date: Literal["asc", "desc"] | None = None
+            sort_by_date: Literal["asc", "desc"] | None = None,
+            cursor: str | None = None,
+            fields: list[str] | None = None,
     ) -> list[Order]:
         filters = [Order.user_id == user_id]
-        options = [selectinload(Order.items).joinedload(OrderItem.sneaker_variant).joinedload(SneakerVariant.model)]
+        options = []
+        if fields is None or "items" in fields:
+            options.append(_order_items_loader())
+        columns = None
+        if fields is not None:
+            required_fields = {"id", "order_date"} if sort_by_date else {"id"}
+            columns = [field for field in ORDER_READ_FIELDS if field in fields or field in required_fields]
         order_by = ("order_date", sort_by_date) if sort_by_date else None
+        after = parse_cursor(cursor, order_by) if cursor else None
 
         order_item_filters = []
         sneaker_variant_filters = []
@@ -50,12 +71,8 @@ class OrderService:
             sneaker_model_filters.append(SneakerModel.brand == sneaker_brand)
 
         if search_query:
-            search_pattern = f"%{search_query}%"
             sneaker_model_filters.append(
-                or_(
-                    SneakerModel.name.ilike(search_pattern),
-                    SneakerModel.description.ilike(search_pattern)
-                )
+                matches(SneakerModel.search_vector, websearch_query(search_query))
             )
 
         if sneaker_model_filters:
@@ -70,12 +87,21 @@ class OrderService:
             joins=joins,
             order_by=order_by,
             options=options,
-            offset=offset,
-            limit=limit
+            offset=None if after else offset,
+            limit=limit,
+            after=after,
+            columns=columns,
         )
 
         return orders
 
+    def stream_orders(self, user_id: int | None = None, batch_size: int = 1000) -> AsyncIterator[Order]:
+        return self._order_repo.stream_all_with_filters(
+            filters=[Order.user_id == user_id] if user_id is not None else None,
+            options=[_order_items_loader()],
+            batch_size=batch_size,
+        )
+
     async def get_order_by_id(self, order_id: int) -> Order:
         order = await self._order_repo.find_one_by_field(id=order_id)
         if not order:
@@ -8,8 +8,9 @@ from core.exceptions import (
     UnverifiedEmailException,
     InsufficientPermissionsException,
 )
-from db.models.users import User
+from schemas.users.users import CurrentUser
 from services.jwt import TokenService
+from services.user_cache import AuthenticatedUserCache, authenticated_user_cache
 from services.users import UserService
 
 
@@ -20,30 +21,36 @@ class SecurityService:
             self,
             user_service_factory: Callable[[], UserService],
             token_service_factory: Callable[[], TokenService],
+            user_cache: AuthenticatedUserCache = authenticated_user_cache,
     ):
         self.user_service = user_service_factory()
         self.token_service = token_service_factory()
+        self.user_cache = user_cache
 
-    async def get_current_user(self, token: str) -> User:
+    async def get_current_user(self, token: str) -> CurrentUser:
         payload = await self.token_service.verify_token(token)
         username = await self.token_service.get_username_from_token_payload(payload)
 
         if not username:
             raise InvalidCredentialsException()
 
-        user = await self.user_service.get_user_by_username(username)
+        user = self.user_cache.get(username)
+        if user is None:
+            generation = self.user_cache.generation
+            user = (await self.user_service.get_user_by_username(username)).to_current_user()
+            self.user_cache.set(user, generation)
 
         if not user.is_active:
             raise InactiveUserException()
 
         return user
 
-    async def get_current_active_verified_user(self, current_user: User) -> User:
+    async def get_current_active_verified_user(self, current_user: CurrentUser) -> CurrentUser:
         if not current_user.is_verified:
             raise UnverifiedEmailException()
         return current_user
 
-    async def get_current_superuser(self, current_user: User) -> User:
+    async def get_current_superuser(self, current_user: CurrentUser) -> CurrentUser:
         if not current_user.is_superuser:
             raise InsufficientPermissionsException()
         return current_user
@@ -1,17 +1,26 @@
-from typing import Callable, Any, Literal
+from typing import Callable, Any, Literal, AsyncIterator
 
-from sqlalchemy import or_, and_
+from sqlalchemy import func, Float
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
+from core.config.config import settings
 from core.exceptions import (
     ItemAlreadyExistsException,
     ItemNotFoundException,
     NoDataProvidedException,
 )
+from core.utils.pagination import parse_cursor
 from core.utils.repository import AbstractRepository
-from db.models.sneakers import SneakerModel, SneakerVariant
-from schemas.sneaker_model.sneaker_model import SneakerModelCreate, SneakerModelUpdate
+from core.utils.search import websearch_query, matches, rank
+from db.models.sneakers import SNEAKER_MODEL_READ_FIELDS, SneakerModel, SneakerVariant
+from schemas.sneaker_model.sneaker_model import (
+    SneakerModelCreate,
+    SneakerModelUpdate,
+    SneakerModelSuggestions,
+)
+from services.catalog_cache import suggestions_cache, catalog_version, invalidate_catalog
 
 
 class SneakerModelService:
@@ -32,10 +41,11 @@ class SneakerModelService:
                 await self._handle_unique_violation({"name": sneaker_model.name})
             raise
 
+        self._sneaker_model_repo.after_commit(invalidate_catalog)
         return sneaker
 
-    async def get_sneakers_models_with_filters(
-            self,
+    @staticmethod
+    def _build_filters(
             sneaker_model_id: int | None = None,
             name: str | None = None,
             brand: str | None = None,
@@ -44,16 +54,9 @@ class SneakerModelService:
             max_price: float | None = None,
             sizes: list[float] | None = None,
             search_query: str | None = None,
-            include_variants: bool = False,
             in_stock: bool | None = None,
-            offset: int | None = None,
-            limit: int | None = None,
-            sort_by_price: Literal["asc", "desc"] | None = None,
-    ) -> list[SneakerModel]:
+    ) -> list:
         filters = []
-        variant_filters = []
-        options = []
-        joins = {}
 
         if sneaker_model_id:
             filters.append(SneakerModel.id == sneaker_model_id)
@@ -69,38 +72,126 @@ class SneakerModelService:
             filters.append(SneakerModel.price <= max_price)
 
         if sizes:
-            variant_filters.append(SneakerVariant.size.in_(sizes))
+            filters.append(SneakerModel.available_sizes.overlap(sizes))
 
         if in_stock is not None:
-            variant_condition = (
-                SneakerVariant.quantity > 0
-                if in_stock
-                else SneakerVariant.quantity == 0
-            )
-            variant_filters.append(variant_condition)
-
-        if variant_filters:
-            joins["variants"] = and_(*variant_filters)
+            filters.append(SneakerModel.in_stock.is_(in_stock))
 
         if search_query:
-            search_pattern = f"%{search_query}%"
-            filters.append(
-                or_(
-                    SneakerModel.name.ilike(search_pattern),
-                    SneakerModel.description.ilike(search_pattern),
-                )
-            )
+            filters.append(matches(SneakerModel.search_vector, websearch_query(search_query)))
+
+        return filters
+
+    async def get_sneakers_models_with_filters(
+            self,
+            sneaker_model_id: int | None = None,
+            name: str | None = None,
+            brand: str | None = None,
+            sneaker_model_type: str | None = None,
+            min_price: float | None = None,
+            max_price: float | None = None,
+            sizes: list[float] | None = None,
+            search_query: str | None = None,
+            include_variants: bool = False,
+            in_stock: bool | None = None,
+            offset: int | None = None,
+            limit: int | None = None,
+            sort_by_price: Literal["asc", "desc"] | None = None,
+            sort_by_relevance: bool = False,
+            cursor: str | None = None,
+            fields: list[str] | None = None,
+    ) -> list[SneakerModel]:
+        filters = self._build_filters(
+            sneaker_model_id=sneaker_model_id,
+            name=name,
+            brand=brand,
+            sneaker_model_type=sneaker_model_type,
+            min_price=min_price,
+            max_price=max_price,
+            sizes=sizes,
+            search_query=search_query,
+            in_stock=in_stock,
+        )
+        options = []
+
+        order_by = ("price", sort_by_price) if sort_by_price else None
+        if search_query and sort_by_relevance:
+            order_by = (rank(SneakerModel.search_vector, websearch_query(search_query)), "desc")
 
         if include_variants:
-            options.append(joinedload(SneakerModel.variants))
+            options.append(selectinload(SneakerModel.variants))
+
+        columns = SNEAKER_MODEL_READ_FIELDS
+        if fields is not None:
+            # The keyset cursor always needs id and, when sorting by it, price
+            required_fields = {"id", "price"} if sort_by_price else {"id"}
+            columns = [field for field in columns if field in fields or field in required_fields]
+
+        after = parse_cursor(cursor, order_by) if cursor else None
 
         return await self._sneaker_model_repo.find_all_with_filters(
             filters=filters,
-            joins=joins,
             options=options,
-            offset=offset,
+            offset=None if after else offset,
             limit=limit,
-            order_by=("price", sort_by_price) if sort_by_price else None,
+            order_by=order_by,
+            after=after,
+            columns=columns,
+        )
+
+    async def get_all_sneakers_models(self) -> list[SneakerModel]:
+        return await self._sneaker_model_repo.find_all_with_filters(
+            options=[selectinload(SneakerModel.variants)],
+            columns=SNEAKER_MODEL_READ_FIELDS,
+        )
+
+    def stream_sneakers_models(
+            self, include_variants: bool = False, batch_size: int = 1000
+    ) -> AsyncIterator[SneakerModel]:
+        return self._sneaker_model_repo.stream_all_with_filters(
+            options=[selectinload(SneakerModel.variants)] if include_variants else None,
+            columns=SNEAKER_MODEL_READ_FIELDS,
+            batch_size=batch_size,
+        )
+
+    async def get_sneakers_models_facets(
+            self,
+            sneaker_model_id: int | None = None,
+            name: str | None = None,
+            brand: str | None = None,
+            sneaker_model_type: str | None = None,
+            min_price: float | None = None,
+            max_price: float | None = None,
+            sizes: list[float] | None = None,
+            search_query: str | None = None,
+            in_stock: bool | None = None,
+    ) -> dict[str, dict[Any, int]]:
+        filters = self._build_filters(
+            sneaker_model_id=sneaker_model_id,
+            name=name,
+            brand=brand,
+            sneaker_model_type=sneaker_model_type,
+            min_price=min_price,
+            max_price=max_price,
+            sizes=sizes,
+            search_query=search_query,
+            in_stock=in_stock,
+        )
+        price_buckets = array(
+            [float(bound) for bound in settings.catalog_settings.PRICE_BUCKETS], type_=Float
+        )
+        facets = {
+            "brand": SneakerModel.brand,
+            "type": SneakerModel.type,
+            "size": SneakerVariant.size,
+            "price_bucket": func.width_bucket(SneakerModel.price, price_buckets),
+        }
+
+        # Only in-stock variants, matching the sizes filter on available_sizes
+        return await self._sneaker_model_repo.count_facets(
+            facets,
+            filters=filters,
+            outer_joins=[SneakerModel.variants.and_(SneakerVariant.quantity > 0)],
         )
 
     async def update_sneaker_model(
@@ -120,9 +211,25 @@ class SneakerModelService:
                 await self._handle_unique_violation({"name": update_sneaker_model.name})
             raise
 
+        self._sneaker_model_repo.after_commit(invalidate_catalog)
         return updated_sneaker_model
 
     async def delete_sneaker_model(self, sneaker_model_id: int) -> None:
         success = await self._sneaker_model_repo.delete_one(sneaker_model_id)
         if not success:
             raise ItemNotFoundException("SneakerModel", "id", str(sneaker_model_id))
+        self._sneaker_model_repo.after_commit(invalidate_catalog)
+
+    async def suggest_sneaker_models(self, query: str, limit: int) -> SneakerModelSuggestions:
+        query = " ".join(query.split()).lower()
+        cache_key = (catalog_version.value, query, limit)
+        suggestions = suggestions_cache.get(cache_key)
+        if suggestions is not None:
+            return suggestions
+
+        suggestions = SneakerModelSuggestions(
+            names=await self._sneaker_model_repo.find_similar_values("name", query, limit),
+            brands=await self._sneaker_model_repo.find_similar_values("brand", query, limit),
+        )
+        suggestions_cache.set(cache_key, suggestions)
+        return suggestions
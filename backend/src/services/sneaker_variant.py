@@ -7,6 +7,7 @@ from core.exceptions import ItemAlreadyExistsException, ItemNotFoundException, I
 from core.utils.repository import AbstractRepository
 from db.models.sneakers import SneakerVariant
 from schemas.sneaker_variant.sneaker_variant import SneakerVariantCreate
+from services.catalog_cache import invalidate_catalog
 
 
 class SneakerVariantService:
@@ -53,6 +54,8 @@ class SneakerVariantService:
                     "size": sneaker_variant.size
                 })
             raise
+
+        self._sneaker_variant_repo.after_commit(invalidate_catalog)
         return sneaker_variant_id
 
     async def update_quantity_by_delta(self, sneaker_variant_id: int, delta: int) -> SneakerVariant:
@@ -67,13 +70,28 @@ class SneakerVariantService:
         if updated_sneaker_variant is None:
             raise ItemNotFoundException("SneakerVariant", "id", str(sneaker_variant_id))
 
+        self._sneaker_variant_repo.after_commit(invalidate_catalog)
         return updated_sneaker_variant
 
+    async def reserve_quantities(self, quantities: dict[int, int]) -> list[SneakerVariant]:
+        deltas = {sneaker_variant_id: -quantity for sneaker_variant_id, quantity in quantities.items()}
+        updated_sneaker_variants = await self._sneaker_variant_repo.increment_many(
+            "quantity",
+            deltas,
+            min_value=0,
+        )
+        if len(updated_sneaker_variants) != len(quantities):
+            raise InvalidFieldValueException("SneakerVariant.quantity", "non-negative number")
+
+        self._sneaker_variant_repo.after_commit(invalidate_catalog)
+        return updated_sneaker_variants
+
     async def delete_sneaker_variant(self, sneaker_variant_id: int) -> None:
         try:
             success = await self._sneaker_variant_repo.delete_one(sneaker_variant_id)
             if not success:
                 raise ItemNotFoundException("SneakerVariant", "id", str(sneaker_variant_id))
+            self._sneaker_variant_repo.after_commit(invalidate_catalog)
         except ItemNotFoundException:
             raise
         except IntegrityError as e:
@@ -0,0 +1,54 @@
+from core.config.config import settings
+from core.utils.cache import TTLCache
+from schemas.users.users import CurrentUser
+
+
+class AuthenticatedUserCache:
+    """Auth-relevant user fields keyed by username (the token subject).
+
+    Entries are dropped by user id when UserService changes them; the short ttl bounds how long
+    another worker process can keep serving a stale entry.
+
+    Every invalidation bumps the generation. A reader snapshots it before loading the user and
+    passes it to set, so a row read before a commit is not cached after that commit's invalidation.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._users = TTLCache(maxsize=maxsize, ttl=ttl)
+        # id -> username for invalidate; trimmed to the usernames still in _users
+        self._usernames: dict[int, str] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, username: str) -> CurrentUser | None:
+        return self._users.get(username)
+
+    def set(self, user: CurrentUser, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._users.set(user.username, user)
+        if self._users.maxsize <= 0:
+            return
+        self._usernames[user.id] = user.username
+        if len(self._usernames) > 2 * self._users.maxsize:
+            self._usernames = {
+                user_id: username for user_id, username in self._usernames.items() if username in self._users
+            }
+
+    def invalidate(self, user_id: int) -> None:
+        self._generation += 1
+        username = self._usernames.pop(user_id, None)
+        if username is not None:
+            self._users.pop(username)
+
+    def stats(self) -> dict:
+        return self._users.stats()
+
+
+authenticated_user_cache = AuthenticatedUserCache(
+    maxsize=settings.auth_jwt.user_cache_size if settings.auth_jwt.user_cache_enabled else 0,
+    ttl=settings.auth_jwt.user_cache_ttl_seconds,
+)
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Callable, Any
 
 from pydantic import EmailStr
@@ -11,10 +12,11 @@ from core.exceptions import (
     InvalidCredentialsException,
     UnverifiedEmailException,
 )
-from core.utils.password import get_password_hash, verify_password
+from core.utils.password import password_hasher
 from core.utils.repository import AbstractRepository
 from db.models.users import User
 from schemas.users.users import UserCreate
+from services.user_cache import authenticated_user_cache
 from core.config.config import settings
 
 
@@ -30,7 +32,7 @@ class UserService:
 
     async def create_user(self, user: UserCreate) -> User:
         user_dict = user.model_dump()
-        user_dict["password"] = get_password_hash(user_dict["password"])
+        user_dict["password"] = await password_hasher.hash(user_dict["password"])
 
         try:
             created_user = await self._user_repo.create_one(user_dict)
@@ -65,7 +67,9 @@ class UserService:
         if is_verified and user.is_verified:
             raise UserAlreadyVerifiedException(str(user.id))
 
-        return await self._user_repo.update_one(user.id, {"is_verified": is_verified})
+        updated_user = await self._user_repo.update_one(user.id, {"is_verified": is_verified})
+        self._user_repo.after_commit(partial(authenticated_user_cache.invalidate, user.id))
+        return updated_user
 
     async def get_user_by_id(self, user_id: int, load_orders: bool = False) -> User:
         options = []
@@ -80,6 +84,7 @@ class UserService:
         success = await self._user_repo.delete_one(user_id)
         if not success:
             raise ItemNotFoundException("User", "id", str(user_id))
+        self._user_repo.after_commit(partial(authenticated_user_cache.invalidate, user_id))
 
     async def update_user_email(self, user_id: int, new_email: EmailStr) -> User:
         try:
@@ -92,6 +97,7 @@ class UserService:
                 await self._handle_unique_violation({"email": new_email})
             raise
 
+        self._user_repo.after_commit(partial(authenticated_user_cache.invalidate, user_id))
         return updated_user
 
     async def update_user_username(self, user_id: int, new_username: str) -> User:
@@ -105,10 +111,11 @@ class UserService:
                 await self._handle_unique_violation({"username": new_username})
             raise
 
+        self._user_repo.after_commit(partial(authenticated_user_cache.invalidate, user_id))
         return updated_user
 
     async def update_user_password(self, user_id: int, new_password: str) -> User:
-        hashed_password = get_password_hash(new_password)
+        hashed_password = await password_hasher.hash(new_password)
         return await self._user_repo.update_one(user_id, {"password": hashed_password})
 
     async def change_password(
@@ -116,7 +123,7 @@ class UserService:
     ) -> None:
         user = await self.get_user_by_id(user_id)
 
-        if not verify_password(current_password, user.password):
+        if not await password_hasher.verify(current_password, user.password):
             raise InvalidCredentialsException()
 
         await self.update_user_password(user_id, new_password)
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Callable
 
 from core.exceptions import ItemNotFoundException
@@ -26,6 +27,7 @@ class CreateOrderUseCase(BaseUseCase[CreateOrderInput, OrderOut]):
     async def execute(self, input_data: CreateOrderInput) -> OrderOut:
         total_amount = 0
         order_items = []
+        quantities = defaultdict(int)
 
         variant_ids = [item.sneaker_variant_id for item in input_data.items]
         variant_map = await self.sneaker_variant_service.get_all_by_ids(variant_ids)
@@ -39,8 +41,12 @@ class CreateOrderUseCase(BaseUseCase[CreateOrderInput, OrderOut]):
                 sneaker_variant_id=item.sneaker_variant_id,
                 price_at_time=variant.model.price,
             ))
+            quantities[item.sneaker_variant_id] += item.quantity
             total_amount += variant.model.price * item.quantity
 
+        # Conditional decrement: fails the whole order if any variant is short
+        await self.sneaker_variant_service.reserve_quantities(quantities)
+
         order = await self.order_service.create_order(
             OrderCreate(total_amount=total_amount),
             input_data.user_id
@@ -48,8 +54,7 @@ class CreateOrderUseCase(BaseUseCase[CreateOrderInput, OrderOut]):
 
         for item in order_items:
             item.order_id = order.id
-            await self.order_item_service.create_order_item(item)
-            await self.sneaker_variant_service.update_quantity_by_delta(item.sneaker_variant_id, -item.quantity)
+        await self.order_item_service.create_order_items(order_items)
 
         await self.user_service.update_balance_after_order(input_data.user_id, total_amount)
 
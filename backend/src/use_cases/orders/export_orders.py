@@ -0,0 +1,28 @@
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from core.config.config import settings
+from core.utils.export import encode_export
+from schemas.orders.orders import OrderOut
+from schemas.orders.use_cases import ExportOrdersInput
+from services.orders import OrderService
+from use_cases.base import BaseUseCase
+
+
+class ExportOrdersUseCase(BaseUseCase[ExportOrdersInput, AsyncIterator[bytes]]):
+    def __init__(
+            self, order_service_factory: Callable[[], AsyncContextManager[OrderService]]
+    ):
+        self.order_service_factory = order_service_factory
+
+    async def execute(self, input_data: ExportOrdersInput) -> AsyncIterator[bytes]:
+        return self._stream(input_data)
+
+    async def _stream(self, input_data: ExportOrdersInput) -> AsyncIterator[bytes]:
+        batch_size = settings.catalog_settings.EXPORT_BATCH_SIZE
+        async with self.order_service_factory() as order_service:
+            orders = order_service.stream_orders(user_id=input_data.user_id, batch_size=batch_size)
+            read_models = (order.to_read_model(include_items=True) async for order in orders)
+            async for chunk in encode_export(
+                    read_models, input_data.export_format, list(OrderOut.model_fields), batch_size
+            ):
+                yield chunk
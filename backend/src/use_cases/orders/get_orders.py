@@ -1,12 +1,13 @@
 from typing import Callable
 
-from schemas.orders.orders import OrderOut
+from core.utils.pagination import build_cursor
+from schemas.orders.orders import OrderPage
 from schemas.orders.use_cases import GetOrdersInput
 from services.orders import OrderService
 from use_cases.base import BaseUseCase
 
 
-class GetOrdersUseCase(BaseUseCase[None, list[OrderOut]]):
+class GetOrdersUseCase(BaseUseCase[None, OrderPage]):
     def __init__(
             self, order_service_factory: Callable[[], OrderService]
     ):
@@ -14,7 +15,11 @@ class GetOrdersUseCase(BaseUseCase[None, list[OrderOut]]):
 
     async def execute(
             self, input_data: GetOrdersInput
-    ) -> list[OrderOut]:
+    ) -> OrderPage:
+        sort_by_date = input_data.params.sort_by_date
+        limit = input_data.params.limit
+        fields = input_data.params.fields
+        include_items = fields is None or "items" in fields
         orders = await self.order_service.get_user_orders(
             user_id=input_data.user_id,
             order_id=input_data.params.order_id,
@@ -22,7 +27,18 @@ class GetOrdersUseCase(BaseUseCase[None, list[OrderOut]]):
             sneaker_brand=input_data.params.sneaker_brand,
             search_query=input_data.params.search_query,
             offset=input_data.params.offset,
-            limit=input_data.params.limit,
-            sort_by_date=input_data.params.sort_by_date,
+            limit=limit,
+            sort_by_date=sort_by_date,
+            cursor=input_data.params.cursor,
+            fields=fields,
+        )
+
+        next_cursor = None
+        if limit and len(orders) == limit:
+            order_by = ("order_date", sort_by_date) if sort_by_date else None
+            next_cursor = build_cursor(orders[-1], order_by)
+
+        return OrderPage(
+            items=[order.to_read_model(include_items=include_items, fields=fields) for order in orders],
+            next_cursor=next_cursor,
         )
-        return [order.to_read_model(include_items=True) for order in orders]
@@ -0,0 +1,35 @@
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from core.config.config import settings
+from core.utils.export import encode_export
+from schemas.sneaker_model.sneaker_model import SneakerModelOut
+from schemas.sneaker_model.use_cases import ExportSneakerModelsInput
+from services.sneaker_model import SneakerModelService
+from use_cases.base import BaseUseCase
+
+
+class ExportSneakerModelsUseCase(BaseUseCase[ExportSneakerModelsInput, AsyncIterator[bytes]]):
+    def __init__(
+            self, sneaker_model_service_factory: Callable[[], AsyncContextManager[SneakerModelService]]
+    ):
+        self.sneaker_model_service_factory = sneaker_model_service_factory
+
+    async def execute(self, input_data: ExportSneakerModelsInput) -> AsyncIterator[bytes]:
+        return self._stream(input_data)
+
+    async def _stream(self, input_data: ExportSneakerModelsInput) -> AsyncIterator[bytes]:
+        batch_size = settings.catalog_settings.EXPORT_BATCH_SIZE
+        fieldnames = [
+            field for field in SneakerModelOut.model_fields
+            if field != "variants" or input_data.include_variants
+        ]
+        async with self.sneaker_model_service_factory() as sneaker_model_service:
+            sneakers_models = sneaker_model_service.stream_sneakers_models(
+                include_variants=input_data.include_variants, batch_size=batch_size
+            )
+            read_models = (
+                sneaker_model.to_read_model(include_variants=input_data.include_variants)
+                async for sneaker_model in sneakers_models
+            )
+            async for chunk in encode_export(read_models, input_data.export_format, fieldnames, batch_size):
+                yield chunk
@@ -1,12 +1,15 @@
-from typing import List, Callable
+from typing import Callable
 
-from schemas.sneaker_model.sneaker_model import SneakerModelOut
+from core.utils.pagination import build_cursor, parse_cursor
+from schemas.sneaker_model.sneaker_model import SneakerModelOut, SneakerModelPage, SneakerModelParams
 from schemas.sneaker_model.use_cases import GetSneakersModelsInput
+from services.catalog_cache import catalog_cache, catalog_version
+from services.catalog_engine import catalog_engine
 from services.sneaker_model import SneakerModelService
 from use_cases.base import BaseUseCase
 
 
-class GetSneakersModelsUseCase(BaseUseCase[None, List[SneakerModelOut]]):
+class GetSneakersModelsUseCase(BaseUseCase[None, SneakerModelPage]):
     def __init__(
             self, sneaker_model_service_factory: Callable[[], SneakerModelService]
     ):
@@ -14,8 +17,22 @@ class GetSneakersModelsUseCase(BaseUseCase[None, List[SneakerModelOut]]):
 
     async def execute(
             self, input_data: GetSneakersModelsInput
-    ) -> List[SneakerModelOut]:
-        include_variants = input_data.params.include_variants or False
+    ) -> SneakerModelPage:
+        cache_key = self._cache_key(input_data.params)
+        cached_page = catalog_cache.get(cache_key)
+        if cached_page is not None:
+            return cached_page
+
+        fields = input_data.params.fields
+        include_variants = bool(input_data.params.include_variants and (fields is None or "variants" in fields))
+        sort_by_price = input_data.params.sort_by_price
+        sort_by_relevance = bool(input_data.params.sort_by_relevance and input_data.params.search_query)
+        limit = input_data.params.limit
+        if catalog_engine is not None and not input_data.params.search_query:
+            sneakers_models_page = await self._find_in_catalog_engine(input_data.params)
+            catalog_cache.set(cache_key, sneakers_models_page)
+            return sneakers_models_page
+
         sneakers_models = (
             await self.sneaker_model_service.get_sneakers_models_with_filters(
                 sneaker_model_id=input_data.params.sneaker_model_id,
@@ -29,13 +46,72 @@ class GetSneakersModelsUseCase(BaseUseCase[None, List[SneakerModelOut]]):
                 include_variants=include_variants,
                 in_stock=input_data.params.in_stock,
                 offset=input_data.params.offset,
-                limit=input_data.params.limit,
-                sort_by_price=input_data.params.sort_by_price,
+                limit=limit,
+                sort_by_price=sort_by_price,
+                sort_by_relevance=sort_by_relevance,
+                cursor=input_data.params.cursor,
+                fields=fields,
             )
         )
-        return [
-            sneaker_model.to_read_model(
-                include_variants=include_variants,
+
+        next_cursor = None
+        # Relevance ranking is not a stored column, so those pages use offset only
+        if limit and len(sneakers_models) == limit and not sort_by_relevance:
+            order_by = ("price", sort_by_price) if sort_by_price else None
+            next_cursor = build_cursor(sneakers_models[-1], order_by)
+
+        sneakers_models_page = SneakerModelPage(
+            items=[
+                sneaker_model.to_read_model(
+                    include_variants=include_variants,
+                    fields=fields,
+                )
+                for sneaker_model in sneakers_models
+            ],
+            next_cursor=next_cursor,
+        )
+        catalog_cache.set(cache_key, sneakers_models_page)
+        return sneakers_models_page
+
+    async def _find_in_catalog_engine(self, params: SneakerModelParams) -> SneakerModelPage:
+        order_by = ("price", params.sort_by_price) if params.sort_by_price else None
+        after = parse_cursor(params.cursor, order_by) if params.cursor else None
+        catalog_index = await catalog_engine.get_index(self.sneaker_model_service.get_all_sneakers_models)
+        positions = catalog_index.find(
+            sneaker_model_id=params.sneaker_model_id,
+            name=params.name,
+            brand=params.brand,
+            sneaker_model_type=params.sneaker_model_type,
+            min_price=params.min_price,
+            max_price=params.max_price,
+            sizes=params.sizes,
+            include_variants=params.include_variants or False,
+            in_stock=params.in_stock,
+            offset=None if after else params.offset,
+            limit=params.limit,
+            sort_by_price=params.sort_by_price,
+            after=after,
+        )
+
+        items_json = catalog_index.items_json(positions, include_variants=params.include_variants or False)
+
+        next_cursor = None
+        if params.limit and len(positions) == params.limit:
+            next_cursor = build_cursor(catalog_index.keyset(positions[-1]), order_by)
+        if params.fields:
+            # Trimming to fields needs the items decoded; full pages go out as the stored bytes
+            return SneakerModelPage(
+                items=[SneakerModelOut.model_validate_json(item) for item in items_json],
+                next_cursor=next_cursor,
             )
-            for sneaker_model in sneakers_models
-        ]
+        return SneakerModelPage(items=[], next_cursor=next_cursor, items_json=b"[" + b",".join(items_json) + b"]")
+
+    @staticmethod
+    def _cache_key(params: SneakerModelParams) -> tuple[str, int, str]:
+        normalized_params = params.model_copy(update={
+            "sizes": sorted(set(params.sizes)) if params.sizes else None,
+            "search_query": " ".join(params.search_query.split()) if params.search_query else None,
+            "include_variants": params.include_variants or None,
+            "fields": sorted(set(params.fields)) if params.fields else None,
+        })
+        return "sneaker_models", catalog_version.value, normalized_params.model_dump_json(exclude_none=True)
@@ -0,0 +1,87 @@
+from typing import Callable
+
+from core.config.config import settings
+from schemas.sneaker_model.sneaker_model import (
+    FacetCount,
+    PriceBucketCount,
+    SneakerModelFacets,
+    SneakerModelFacetsOut,
+)
+from schemas.sneaker_model.use_cases import GetSneakerModelsFacetsInput
+from services.sneaker_model import SneakerModelService
+from use_cases.base import BaseUseCase
+
+
+class GetSneakerModelsFacetsUseCase(BaseUseCase[GetSneakerModelsFacetsInput, SneakerModelFacetsOut]):
+    def __init__(
+            self, sneaker_model_service_factory: Callable[[], SneakerModelService]
+    ):
+        self.sneaker_model_service = sneaker_model_service_factory()
+
+    async def execute(self, input_data: GetSneakerModelsFacetsInput) -> SneakerModelFacetsOut:
+        params = input_data.params
+        facets = await self.sneaker_model_service.get_sneakers_models_facets(
+            sneaker_model_id=params.sneaker_model_id,
+            name=params.name,
+            brand=params.brand,
+            sneaker_model_type=params.sneaker_model_type,
+            min_price=params.min_price,
+            max_price=params.max_price,
+            sizes=params.sizes,
+            search_query=params.search_query,
+            in_stock=params.in_stock,
+        )
+
+        items = None
+        if input_data.include_results:
+            include_variants = params.include_variants or False
+            sneakers_models = await self.sneaker_model_service.get_sneakers_models_with_filters(
+                sneaker_model_id=params.sneaker_model_id,
+                name=params.name,
+                brand=params.brand,
+                sneaker_model_type=params.sneaker_model_type,
+                min_price=params.min_price,
+                max_price=params.max_price,
+                sizes=params.sizes,
+                search_query=params.search_query,
+                include_variants=include_variants,
+                in_stock=params.in_stock,
+                offset=params.offset,
+                limit=params.limit,
+                sort_by_price=params.sort_by_price,
+                sort_by_relevance=bool(params.sort_by_relevance and params.search_query),
+                cursor=params.cursor,
+            )
+            items = [
+                sneaker_model.to_read_model(include_variants=include_variants)
+                for sneaker_model in sneakers_models
+            ]
+
+        return SneakerModelFacetsOut(
+            facets=SneakerModelFacets(
+                brands=self._to_facet_counts(facets["brand"]),
+                types=self._to_facet_counts(facets["type"]),
+                sizes=self._to_facet_counts(facets["size"]),
+                price_buckets=self._to_price_bucket_counts(facets["price_bucket"]),
+            ),
+            items=items,
+        )
+
+    @staticmethod
+    def _to_facet_counts(counts: dict) -> list[FacetCount]:
+        return [
+            FacetCount(value=value, count=count)
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    @staticmethod
+    def _to_price_bucket_counts(counts: dict[int, int]) -> list[PriceBucketCount]:
+        bounds = settings.catalog_settings.PRICE_BUCKETS
+        return [
+            PriceBucketCount(
+                min_price=bounds[bucket - 1] if bucket > 0 else None,
+                max_price=bounds[bucket] if bucket < len(bounds) else None,
+                count=counts[bucket],
+            )
+            for bucket in sorted(counts)
+        ]
@@ -0,0 +1,19 @@
+from typing import Callable
+
+from schemas.sneaker_model.sneaker_model import SneakerModelImportReport
+from schemas.sneaker_model.use_cases import ImportSneakerModelsInput
+from services.catalog_import import CatalogImportService
+from use_cases.base import BaseUseCase
+
+
+class ImportSneakerModelsUseCase(BaseUseCase[ImportSneakerModelsInput, SneakerModelImportReport]):
+    def __init__(
+            self,
+            catalog_import_service_factory: Callable[[], CatalogImportService],
+    ):
+        self.catalog_import_service = catalog_import_service_factory()
+
+    async def execute(self, input_data: ImportSneakerModelsInput) -> SneakerModelImportReport:
+        return await self.catalog_import_service.import_sneakers_models(
+            input_data.lines, input_data.import_format
+        )
@@ -0,0 +1,19 @@
+from typing import Callable
+
+from schemas.sneaker_model.sneaker_model import SneakerModelSuggestions
+from schemas.sneaker_model.use_cases import SuggestSneakerModelsInput
+from services.sneaker_model import SneakerModelService
+from use_cases.base import BaseUseCase
+
+
+class SuggestSneakerModelsUseCase(BaseUseCase[SuggestSneakerModelsInput, SneakerModelSuggestions]):
+    def __init__(
+            self, sneaker_model_service_factory: Callable[[], SneakerModelService]
+    ):
+        self.sneaker_model_service = sneaker_model_service_factory()
+
+    async def execute(self, input_data: SuggestSneakerModelsInput) -> SneakerModelSuggestions:
+        return await self.sneaker_model_service.suggest_sneaker_models(
+            input_data.query,
+            input_data.limit,
+        )
@@ -2,6 +2,7 @@ from typing import Callable
 
 from schemas.sneaker_variant.sneaker_variant import SneakerVariantOut
 from schemas.sneaker_variant.use_cases import GetSneakerVariantInput
+from services.catalog_cache import catalog_cache, catalog_version
 from services.sneaker_variant import SneakerVariantService
 from use_cases.base import BaseUseCase
 
@@ -15,5 +16,12 @@ class GetSneakerVariantUseCase(BaseUseCase[None, SneakerVariantOut]):
     async def execute(
             self, input_data: GetSneakerVariantInput
     ) -> SneakerVariantOut:
+        cache_key = ("sneaker_variant", catalog_version.value, input_data.sneaker_variant_id)
+        cached_sneaker_variant = catalog_cache.get(cache_key)
+        if cached_sneaker_variant is not None:
+            return cached_sneaker_variant
+
         sneaker_variant = await self.sneaker_variant_service.get_sneaker_variant_by_id(input_data.sneaker_variant_id)
-        return sneaker_variant.to_read_model()
+        sneaker_variant_out = sneaker_variant.to_read_model()
+        catalog_cache.set(cache_key, sneaker_variant_out)
+        return sneaker_variant_out
@@ -11,5 +11,5 @@ class GetUserUseCase(BaseUseCase[GetUserInput, UserOut]):
         self.user_service = user_service_factory()
 
     async def execute(self, input_data: GetUserInput) -> UserOut:
-        user = await self.user_service.get_user_by_id(input_data.user_id, load_orders=True)
-        return user.to_read_model(include_orders=True)
+        user = await self.user_service.get_user_by_id(input_data.user_id, load_orders=input_data.include_orders)
+        return user.to_read_model(include_orders=input_data.include_orders)
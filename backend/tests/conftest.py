@@ -0,0 +1,51 @@
+from typing import AsyncIterator
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config.config import BASE_DIR, settings
+from db.session.database import DatabaseHelper
+
+TEST_DB_URL = (
+    f"postgresql+asyncpg://"
+    f"{settings.test_db_settings.TEST_DB_USER}:"
+    f"{settings.test_db_settings.TEST_DB_PASSWORD}@"
+    f"{settings.test_db_settings.TEST_DB_HOST}:"
+    f"{settings.test_db_settings.TEST_DB_PORT}/"
+    f"{settings.test_db_settings.TEST_DB_NAME}"
+)
+
+
+@pytest.fixture(scope="session")
+def migrated_test_db() -> str:
+    config = Config(str(BASE_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BASE_DIR / "src" / "migrations"))
+    config.set_main_option("sqlalchemy.url", TEST_DB_URL)
+    command.upgrade(config, "head")
+    return TEST_DB_URL
+
+
+@pytest.fixture
+async def test_db_helper(migrated_test_db: str) -> AsyncIterator[DatabaseHelper]:
+    helper = DatabaseHelper(
+        url=migrated_test_db,
+        echo=False,
+        pool_size=5,
+        max_overflow=0,
+        query_cache_size=settings.db_settings.DB_QUERY_CACHE_SIZE,
+    )
+    yield helper
+    await helper.engine.dispose()
+
+
+@pytest.fixture
+async def rollback_session(test_db_helper: DatabaseHelper) -> AsyncIterator[AsyncSession]:
+    """A session whose transaction is always rolled back, so tests leave no rows behind."""
+    async with test_db_helper.async_session_maker() as session:
+        transaction = await session.begin()
+        try:
+            yield session
+        finally:
+            await transaction.rollback()
@@ -0,0 +1,25 @@
+from starlette.requests import Request
+
+from core.utils.http_cache import build_etag, etag_matches
+
+
+def _request(path: str, query: str = "", if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": headers})
+
+
+def test_etag_differs_per_path():
+    assert build_etag("1", _request("/api/v1/sneaker_variant/1")) != build_etag("1", _request("/api/v1/sneaker_variant/2"))
+
+
+def test_etag_matches_listed_etag():
+    etag = build_etag("1", _request("/api/v1/sneaker_variant/1"))
+    assert etag_matches(_request("/api/v1/sneaker_variant/1", if_none_match=f'"x", {etag}'), etag)
+    assert not etag_matches(_request("/api/v1/sneaker_variant/1", if_none_match='W/"1-other"'), etag)
+
+
+def test_wildcard_needs_existing_resource():
+    request = _request("/api/v1/sneaker_variant/404", if_none_match="*")
+    etag = build_etag("1", request)
+    assert not etag_matches(request, etag)
+    assert etag_matches(request, etag, resource_exists=True)
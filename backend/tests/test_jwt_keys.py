@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+
+from cli.generate_jwt_keys import retire_public_key
+from core.utils.cache import TTLCache
+from core.utils.jwt_keys import JWTKeyManager, generate_key_pair
+from db.models.users import User
+from services.jwt import TokenService
+
+
+def _token_service(keys_dir: Path, algorithm: str, key_id: str | None = None) -> TokenService:
+    key_manager = JWTKeyManager(
+        algorithm=algorithm,
+        private_key_path=keys_dir / "private.pem",
+        public_key_path=keys_dir / "public.pem",
+        verification_keys_dir=keys_dir / "retired",
+        key_id=key_id,
+        reload_interval=0,
+    )
+    return TokenService(key_manager, TTLCache(maxsize=0, ttl=0))
+
+
+def _replace(path: Path, data: bytes) -> None:
+    path.with_suffix(".tmp").write_bytes(data)
+    os.replace(path.with_suffix(".tmp"), path)
+
+
+def _write_key_pair(keys_dir: Path, algorithm: str) -> None:
+    private_pem, public_pem = generate_key_pair(algorithm)
+    _replace(keys_dir / "private.pem", private_pem)
+    _replace(keys_dir / "public.pem", public_pem)
+
+
+async def test_retired_key_verifies_with_its_own_algorithm(tmp_path: Path):
+    (tmp_path / "retired").mkdir()
+    _write_key_pair(tmp_path, "RS256")
+    old_token = (await _token_service(tmp_path, "RS256").create_tokens(User(username="alice"))).access_token
+
+    retire_public_key(tmp_path / "public.pem", tmp_path / "retired", "RS256")
+    _write_key_pair(tmp_path, "EdDSA")
+    token_service = _token_service(tmp_path, "EdDSA")
+    new_token = (await token_service.create_tokens(User(username="bob"))).access_token
+
+    assert (await token_service.verify_token(old_token))["sub"] == "alice"
+    assert (await token_service.verify_token(new_token))["sub"] == "bob"
+
+
+async def test_unreadable_retired_key_is_skipped(tmp_path: Path):
+    (tmp_path / "retired").mkdir()
+    _write_key_pair(tmp_path, "ES256")
+    ed25519_public_pem = generate_key_pair("EdDSA")[1]
+    (tmp_path / "retired" / "mismatched.ES256.pem").write_bytes(ed25519_public_pem)
+    (tmp_path / "retired" / "unknown.HS999.pem").write_bytes(ed25519_public_pem)
+    (tmp_path / "retired" / "garbage.pem").write_bytes(b"not a key")
+    token_service = _token_service(tmp_path, "ES256")
+
+    token = (await token_service.create_tokens(User(username="alice"))).access_token
+
+    assert (await token_service.verify_token(token))["sub"] == "alice"
+    assert token_service.key_manager.verification_key("mismatched") is None
+    assert token_service.key_manager.verification_key("unknown") is None
+    assert token_service.key_manager.verification_key("garbage") is None
+
+
+async def test_reload_of_a_pair_for_another_algorithm_keeps_previous_keys(tmp_path: Path):
+    _write_key_pair(tmp_path, "RS256")
+    token_service = _token_service(tmp_path, "RS256")
+    old_token = (await token_service.create_tokens(User(username="alice"))).access_token
+
+    _write_key_pair(tmp_path, "EdDSA")
+    new_token = (await token_service.create_tokens(User(username="bob"))).access_token
+
+    assert (await token_service.verify_token(old_token))["sub"] == "alice"
+    assert (await token_service.verify_token(new_token))["sub"] == "bob"
+
+
+async def test_half_written_rotation_keeps_previous_keys_until_the_pair_matches(tmp_path: Path):
+    _write_key_pair(tmp_path, "RS256")
+    token_service = _token_service(tmp_path, "RS256")
+    old_kid, _ = token_service.key_manager.signing_key()
+
+    private_pem, public_pem = generate_key_pair("RS256")
+    _replace(tmp_path / "private.pem", private_pem)
+    token = (await token_service.create_tokens(User(username="alice"))).access_token
+    assert token_service.key_manager.signing_key()[0] == old_kid
+    assert (await token_service.verify_token(token))["sub"] == "alice"
+
+    _replace(tmp_path / "public.pem", public_pem)
+    token = (await token_service.create_tokens(User(username="bob"))).access_token
+    assert token_service.key_manager.signing_key()[0] != old_kid
+    assert (await token_service.verify_token(token))["sub"] == "bob"
+
+
+async def test_retired_key_keeps_its_explicit_kid(tmp_path: Path):
+    (tmp_path / "retired").mkdir()
+    _write_key_pair(tmp_path, "ES256")
+    old_token = (await _token_service(tmp_path, "ES256", key_id="k1").create_tokens(User(username="alice"))).access_token
+
+    retire_public_key(tmp_path / "public.pem", tmp_path / "retired", "ES256", key_id="k1")
+    _write_key_pair(tmp_path, "ES256")
+
+    assert (await _token_service(tmp_path, "ES256", key_id="k2").verify_token(old_token))["sub"] == "alice"
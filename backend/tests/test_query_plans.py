@@ -0,0 +1,314 @@
+"""EXPLAIN-plan regression checks for the repository queries behind the hot endpoints.
+
+Every check calls a real service method, captures the SQL it sends (including selectinload
+follow-ups), and re-runs each statement with EXPLAIN (FORMAT JSON). Sequential scans are
+disabled for the session, so a query that no index can serve shows up as a Seq Scan with a
+disabled-node cost and fails its budget even on a small database.
+
+The checks run against the TEST_DB_* database, seed their own uniquely named rows and roll
+everything back. Background rows keep every filter selective, as it is in production, so the
+planner has a reason to pick the index a check expects.
+"""
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.exceptions import BaseModelException
+from repositories.order import OrderRepository
+from repositories.order_item import OrderItemRepository
+from repositories.sneaker_model import SneakerModelRepository
+from repositories.sneaker_variant import SneakerVariantRepository
+from repositories.users import UserRepository
+from services.orders import OrderService
+from services.sneaker_model import SneakerModelService
+from services.users import UserService
+
+SEED_BRANDS = ["nike", "adidas", "puma", "asics"]
+SEED_TYPES = ["running", "basketball", "lifestyle"]
+SEED_SIZES = [40.0, 41.0, 42.0, 43.0, 44.0]
+SEED_MODELS_PER_PAIR = 100
+SEED_ORDERS = 20
+BACKGROUND_MODELS = 5000
+BACKGROUND_BRANDS = 50
+BACKGROUND_USERS = 200
+BACKGROUND_ORDERS_PER_USER = 10
+
+
+@dataclass
+class PlanSeed:
+    tag: str
+    user_id: int
+    username: str
+    email: str
+    brands: list[str]
+    search_term: str
+
+
+@dataclass
+class PlanCheck:
+    name: str
+    run: Callable[[AsyncSession, PlanSeed], Awaitable[Any]]
+    indexes: set[str] = field(default_factory=set)
+    max_cost: float = 10_000.0
+    max_rows: int | None = None
+
+
+@dataclass
+class CapturedPlan:
+    sql: str
+    plan: dict
+
+
+def _sneaker_model_service(session: AsyncSession) -> SneakerModelService:
+    return SneakerModelService(lambda: SneakerModelRepository(session))
+
+
+def _order_service(session: AsyncSession) -> OrderService:
+    return OrderService(lambda: OrderRepository(session))
+
+
+def _user_service(session: AsyncSession) -> UserService:
+    return UserService(lambda: UserRepository(session))
+
+
+PLAN_CHECKS = [
+    PlanCheck(
+        "catalog: default page",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(limit=20),
+        indexes={"sneaker_models_pkey"},
+        max_rows=20,
+    ),
+    PlanCheck(
+        "catalog: sorted by price",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(
+            sort_by_price="asc", limit=20
+        ),
+        indexes={"ix_sneaker_models_price_id"},
+        max_rows=20,
+    ),
+    PlanCheck(
+        "catalog: brand and type, sorted by price",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(
+            brand=seed.brands[0], sneaker_model_type=SEED_TYPES[0], sort_by_price="desc", limit=20
+        ),
+        indexes={"ix_sneaker_models_brand_type_price_id"},
+        max_rows=20,
+    ),
+    PlanCheck(
+        "catalog: in stock, sorted by price",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(
+            in_stock=True, sort_by_price="asc", limit=20
+        ),
+        indexes={"ix_sneaker_models_in_stock_price_id"},
+        max_rows=20,
+    ),
+    PlanCheck(
+        "catalog: sizes",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(
+            sizes=[SEED_SIZES[0]], limit=20
+        ),
+        indexes={"ix_sneaker_models_available_sizes"},
+    ),
+    PlanCheck(
+        "catalog: full-text search",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(
+            search_query=seed.search_term, limit=20
+        ),
+        indexes={"ix_sneaker_models_search_vector"},
+    ),
+    PlanCheck(
+        "catalog: page with variants",
+        lambda session, seed: _sneaker_model_service(session).get_sneakers_models_with_filters(
+            include_variants=True, limit=20
+        ),
+        indexes={"sneaker_models_pkey"},
+    ),
+    PlanCheck(
+        "orders: history page with items",
+        lambda session, seed: _order_service(session).get_user_orders(user_id=seed.user_id, limit=10),
+        indexes={"ix_orders_user_id_id", "ix_order_items_order_id"},
+    ),
+    PlanCheck(
+        "orders: history sorted by date",
+        lambda session, seed: _order_service(session).get_user_orders(
+            user_id=seed.user_id, sort_by_date="desc", limit=10, fields=["id", "order_date"]
+        ),
+        indexes={"ix_orders_user_id_order_date_id"},
+        max_rows=10,
+    ),
+    PlanCheck(
+        "orders: filtered by sneaker brand",
+        lambda session, seed: _order_service(session).get_user_orders(
+            user_id=seed.user_id, sneaker_brand=seed.brands[0], limit=10, fields=["id"]
+        ),
+    ),
+    PlanCheck(
+        "users: by email",
+        lambda session, seed: _user_service(session).get_user_by_email(seed.email),
+        max_rows=1,
+    ),
+    PlanCheck(
+        "users: by username",
+        lambda session, seed: _user_service(session).get_user_by_username(seed.username),
+        max_rows=1,
+    ),
+    PlanCheck(
+        "users: by id with orders",
+        lambda session, seed: _user_service(session).get_user_by_id(seed.user_id, load_orders=True),
+        indexes={"users_pkey"},
+    ),
+]
+
+
+async def seed_background(session: AsyncSession, prefix: str) -> None:
+    """Other brands, mostly sold-out models and other users' orders, none of them matching the tag."""
+    await session.execute(text("""
+        INSERT INTO sneaker_models (name, brand, type, description, price)
+        SELECT prefix || '-model-' || n, prefix || '-brand-' || (n % CAST(:brands AS integer)),
+               (CAST(:types AS text[]))[1 + n % 3], 'background sneaker', 50 + n % 200
+        FROM CAST(:prefix AS text) AS prefix, generate_series(1, CAST(:models AS integer)) AS n
+    """), {"prefix": prefix, "brands": BACKGROUND_BRANDS, "types": SEED_TYPES, "models": BACKGROUND_MODELS})
+    await session.execute(text("""
+        INSERT INTO sneaker_variants (model_id, size, quantity)
+        SELECT sneaker_models.id, size, CASE WHEN sneaker_models.id % 100 = 0 THEN 1 ELSE 0 END
+        FROM sneaker_models, unnest(CAST(:sizes AS double precision[])) AS size
+        WHERE sneaker_models.name LIKE CAST(:prefix AS text) || '-model-%'
+    """), {"prefix": prefix, "sizes": SEED_SIZES})
+    await session.execute(text("""
+        INSERT INTO users (username, email, password, balance, is_superuser, is_active, is_verified)
+        SELECT prefix || '-u' || n, prefix || '-u' || n || '@example.com', '-', 0, false, true, true
+        FROM CAST(:prefix AS text) AS prefix, generate_series(1, CAST(:users AS integer)) AS n
+    """), {"prefix": prefix, "users": BACKGROUND_USERS})
+    await session.execute(text("""
+        INSERT INTO orders (user_id, status, total_amount)
+        SELECT users.id, 'PENDING', 100.0
+        FROM users, generate_series(1, CAST(:orders_per_user AS integer))
+        WHERE users.username LIKE CAST(:prefix AS text) || '-u%'
+    """), {"prefix": prefix, "orders_per_user": BACKGROUND_ORDERS_PER_USER})
+    await session.execute(text("""
+        INSERT INTO order_items (order_id, sneaker_variant_id, quantity, price_at_time)
+        SELECT orders.id, (SELECT min(id) FROM sneaker_variants), 1, 50.0
+        FROM orders JOIN users ON users.id = orders.user_id
+        WHERE users.username LIKE CAST(:prefix AS text) || '-u%'
+    """), {"prefix": prefix})
+
+
+async def seed_database(session: AsyncSession) -> PlanSeed:
+    tag = f"plancheck{uuid.uuid4().hex[:8]}"
+    search_term = f"{tag}term"
+    brands = [f"{tag}-{brand}" for brand in SEED_BRANDS]
+    sneaker_models = await SneakerModelRepository(session).create_many([
+        {
+            "name": f"{brand} {sneaker_model_type} {number}",
+            "brand": brand,
+            "type": sneaker_model_type,
+            # A handful of models carry the search term, so full-text search stays selective
+            "description": f"{search_term if number < 5 else 'catalog'} {sneaker_model_type} sneaker",
+            "price": 50.0 + number * 5,
+        }
+        for brand in brands
+        for sneaker_model_type in SEED_TYPES
+        for number in range(SEED_MODELS_PER_PAIR)
+    ])
+    sneaker_variants = await SneakerVariantRepository(session).create_many([
+        {"model_id": sneaker_model.id, "size": size, "quantity": position % 3}
+        for sneaker_model in sneaker_models
+        for position, size in enumerate(SEED_SIZES)
+    ])
+
+    user = await UserRepository(session).create_one(
+        {"username": tag, "email": f"{tag}@example.com", "password": "-"}
+    )
+    orders = await OrderRepository(session).create_many([
+        {"user_id": user.id, "total_amount": 100.0} for _ in range(SEED_ORDERS)
+    ])
+    await OrderItemRepository(session).create_many([
+        {
+            "order_id": order.id,
+            "sneaker_variant_id": sneaker_variants[(position * 7 + offset) % len(sneaker_variants)].id,
+            "quantity": 1,
+            "price_at_time": 50.0,
+        }
+        for position, order in enumerate(orders)
+        for offset in range(2)
+    ])
+    await seed_background(session, f"bg{tag.removeprefix('plancheck')}")
+
+    for table in ("sneaker_models", "sneaker_variants", "users", "orders", "order_items"):
+        await session.execute(text(f"ANALYZE {table}"))
+    return PlanSeed(
+        tag=tag, user_id=user.id, username=user.username, email=user.email, brands=brands, search_term=search_term
+    )
+
+
+def _iter_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _iter_nodes(child)
+
+
+async def capture_plans(session: AsyncSession, check: PlanCheck, seed: PlanSeed) -> list[CapturedPlan]:
+    connection = await session.connection()
+    statements: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        try:
+            await check.run(session, seed)
+        except BaseModelException:
+            pass
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+    captured = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", tuple(parameters))
+        explain = result.scalar_one()
+        if isinstance(explain, str):
+            explain = json.loads(explain)
+        captured.append(CapturedPlan(sql=statement, plan=explain[0]["Plan"]))
+    return captured
+
+
+def verify(check: PlanCheck, captured: list[CapturedPlan]) -> list[str]:
+    if not captured:
+        return ["no SELECT statement was executed"]
+
+    failures = []
+    used_indexes = set()
+    for number, captured_plan in enumerate(captured, start=1):
+        root = captured_plan.plan
+        for node in _iter_nodes(root):
+            if "Index Name" in node:
+                used_indexes.add(node["Index Name"])
+            if node["Node Type"] == "Seq Scan":
+                failures.append(f"statement {number}: sequential scan on {node['Relation Name']}")
+        if root["Total Cost"] > check.max_cost:
+            failures.append(f"statement {number}: cost {root['Total Cost']:.0f} exceeds {check.max_cost:.0f}")
+    if check.max_rows is not None and captured[0].plan["Plan Rows"] > check.max_rows:
+        failures.append(f"estimated {captured[0].plan['Plan Rows']} rows, budget is {check.max_rows}")
+    for index in sorted(check.indexes - used_indexes):
+        failures.append(f"index {index} not used (used: {', '.join(sorted(used_indexes)) or 'none'})")
+    return failures
+
+
+@pytest.fixture
+async def plan_seed(rollback_session: AsyncSession) -> PlanSeed:
+    seed = await seed_database(rollback_session)
+    await rollback_session.execute(text("SET LOCAL enable_seqscan = off"))
+    return seed
+
+
+@pytest.mark.parametrize("check", PLAN_CHECKS, ids=lambda check: check.name)
+async def test_query_plan(rollback_session: AsyncSession, plan_seed: PlanSeed, check: PlanCheck):
+    failures = verify(check, await capture_plans(rollback_session, check, plan_seed))
+    assert not failures, "\n".join(failures)
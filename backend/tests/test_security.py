@@ -0,0 +1,93 @@
+"""The authenticated-user cache must never outlive a committed change to the user.
+
+Each scenario lets a concurrent request read the user while the change is still uncommitted,
+which is exactly when an invalidation that runs before the commit gets undone.
+"""
+import uuid
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config.config import settings
+from core.exceptions import ItemNotFoundException, UnverifiedEmailException
+from core.utils.cache import TTLCache
+from core.utils.jwt_keys import JWTKeyManager, generate_key_pair
+from db.models.users import User
+from db.session.database import DatabaseHelper
+from repositories.users import UserRepository
+from services.jwt import TokenService
+from services.security import SecurityService
+from services.user_cache import authenticated_user_cache
+from services.users import UserService
+
+
+def _user_service(session: AsyncSession) -> UserService:
+    return UserService(lambda: UserRepository(session))
+
+
+def _security_service(session: AsyncSession, token_service: TokenService) -> SecurityService:
+    return SecurityService(lambda: _user_service(session), lambda: token_service)
+
+
+@pytest.fixture
+def token_service(tmp_path: Path) -> TokenService:
+    private_pem, public_pem = generate_key_pair(settings.auth_jwt.algorithm)
+    (tmp_path / "private.pem").write_bytes(private_pem)
+    (tmp_path / "public.pem").write_bytes(public_pem)
+    key_manager = JWTKeyManager(
+        algorithm=settings.auth_jwt.algorithm,
+        private_key_path=tmp_path / "private.pem",
+        public_key_path=tmp_path / "public.pem",
+    )
+    return TokenService(key_manager, TTLCache(maxsize=0, ttl=0))
+
+
+@pytest.fixture
+async def verified_user(test_db_helper: DatabaseHelper) -> AsyncIterator[User]:
+    tag = f"sec{uuid.uuid4().hex[:8]}"
+    async with test_db_helper.get_session() as session:
+        user = await UserRepository(session).create_one(
+            {"username": tag, "email": f"{tag}@example.com", "password": "-", "is_verified": True}
+        )
+    yield user
+    authenticated_user_cache.invalidate(user.id)
+    async with test_db_helper.get_session() as session:
+        await session.execute(delete(User).where(User.id == user.id))
+
+
+async def test_deleted_user_is_rejected_on_next_request(
+        test_db_helper: DatabaseHelper, token_service: TokenService, verified_user: User
+):
+    token = (await token_service.create_tokens(verified_user)).access_token
+
+    async with test_db_helper.get_session() as session:
+        await _user_service(session).delete_user(verified_user.id)
+        async with test_db_helper.get_session() as concurrent_session:
+            current_user = await _security_service(concurrent_session, token_service).get_current_user(token)
+            assert current_user.id == verified_user.id
+
+    async with test_db_helper.get_session() as session:
+        with pytest.raises(ItemNotFoundException):
+            await _security_service(session, token_service).get_current_user(token)
+
+
+async def test_unverified_user_is_rejected_on_next_request(
+        test_db_helper: DatabaseHelper, token_service: TokenService, verified_user: User
+):
+    token = (await token_service.create_tokens(verified_user)).access_token
+
+    async with test_db_helper.get_session() as session:
+        await _user_service(session).update_user_email(verified_user.id, f"new-{verified_user.email}")
+        async with test_db_helper.get_session() as concurrent_session:
+            current_user = await _security_service(concurrent_session, token_service).get_current_user(token)
+            assert current_user.is_verified
+
+    async with test_db_helper.get_session() as session:
+        security_service = _security_service(session, token_service)
+        current_user = await security_service.get_current_user(token)
+        with pytest.raises(UnverifiedEmailException):
+            await security_service.get_current_active_verified_user(current_user)
+
@@ -0,0 +1,28 @@
+from schemas.users.users import CurrentUser
+from services.user_cache import AuthenticatedUserCache
+
+
+def _user(user_id: int) -> CurrentUser:
+    return CurrentUser(id=user_id, username=f"user{user_id}", is_superuser=False, is_active=True, is_verified=True)
+
+
+def test_read_that_started_before_invalidation_is_not_cached():
+    cache = AuthenticatedUserCache(maxsize=10, ttl=60)
+    generation = cache.generation
+
+    cache.invalidate(1)
+    cache.set(_user(1), generation)
+
+    assert cache.get("user1") is None
+
+
+def test_hot_user_stays_invalidatable_after_many_other_logins():
+    cache = AuthenticatedUserCache(maxsize=4, ttl=60)
+    cache.set(_user(1), cache.generation)
+    for user_id in range(2, 50):
+        assert cache.get("user1") is not None
+        cache.set(_user(user_id), cache.generation)
+
+    cache.invalidate(1)
+
+    assert cache.get("user1") is None